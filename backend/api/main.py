@@ -6,6 +6,7 @@ import time
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from backend.config import settings
 
@@ -25,6 +26,8 @@ app = FastAPI(
     description="API for Cross-Asset Stress Scenario Simulator",
     version="1.0.0",
     debug=settings.debug,
+    # orjson encodes the large scenario/simulation payloads much faster than the stdlib json module
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -146,7 +146,7 @@ async def optimize_portfolio(request: OptimizationRequest, db: Session = Depends
         engine = SimulationEngine(db)
 
         # Prepare data
-        data = engine.prepare_simulation_data(request.tickers, request.start_date, request.end_date)
+        data = engine.prepare_simulation_stats(request.tickers, request.start_date, request.end_date)
 
         # Apply scenario adjustments if provided
         if request.scenario_adjustments:
@@ -4,6 +4,8 @@ import logging
 from datetime import datetime
 from typing import Dict, List
 
+import pandas as pd
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from backend.config import settings
@@ -19,11 +21,47 @@ from backend.data_ingestion.connectors.yfinance_connector import (
     YFinanceConnector,
 )
 from backend.data_ingestion.transformers import DataTransformer
-from backend.data_ingestion.validators import DataValidator
+from backend.data_ingestion.validators import PRICE_COLUMN_DTYPES, DataValidator
 from backend.database import AssetMetadata, AssetPrice, EconomicIndicator
 
 logger = logging.getLogger(__name__)
 
+# Rows per executemany INSERT round trip
+INSERT_BATCH_SIZE = 10_000
+
+PRICE_RECORD_COLUMNS = ["ticker", "asset_class", "date", "open", "high", "low", "close", "volume", "adjusted_close"]
+INDICATOR_RECORD_COLUMNS = ["indicator_code", "indicator_name", "date", "value", "frequency"]
+
+
+def _to_records(df: pd.DataFrame, columns: List[str]) -> List[Dict]:
+    """Convert a frame to insert parameter dicts, mapping missing columns and NaN to None.
+
+    Args:
+        df: Source DataFrame
+        columns: Table columns to emit, in order
+
+    Returns:
+        List of column -> value dictionaries
+    """
+    frame = df.reindex(columns=columns)
+    return frame.astype(object).where(frame.notna(), None).to_dict("records")
+
+
+def _bulk_insert(db: Session, model, records: List[Dict]) -> int:
+    """Insert records with batched executemany statements instead of one ORM object per row.
+
+    Args:
+        db: Database session
+        model: ORM model class to insert into
+        records: Column -> value dictionaries, one per row
+
+    Returns:
+        Number of records inserted
+    """
+    for start in range(0, len(records), INSERT_BATCH_SIZE):
+        db.execute(insert(model), records[start : start + INSERT_BATCH_SIZE])
+    return len(records)
+
 
 class IngestionService:
     """Main service for data ingestion pipeline."""
@@ -66,6 +104,9 @@ class IngestionService:
             logger.warning("No data fetched")
             return 0
 
+        # Pin numeric dtypes so concatenated per-ticker frames never fall back to object columns
+        df = df.astype({col: dtype for col, dtype in PRICE_COLUMN_DTYPES.items() if col in df.columns})
+
         # Validate data
         if validate:
             is_valid, errors = self.validator.validate_price_data(df)
@@ -75,22 +116,8 @@ class IngestionService:
         # Add asset class
         df["asset_class"] = asset_class
 
-        # Insert into database
-        records_inserted = 0
-        for _, row in df.iterrows():
-            asset_price = AssetPrice(
-                ticker=row["ticker"],
-                asset_class=row["asset_class"],
-                date=row["date"],
-                open=row.get("open"),
-                high=row.get("high"),
-                low=row.get("low"),
-                close=row["close"],
-                volume=row.get("volume"),
-                adjusted_close=row.get("adjusted_close"),
-            )
-            db.add(asset_price)
-            records_inserted += 1
+        # Insert into database; optional columns missing from the fetch are stored as NULL
+        records_inserted = _bulk_insert(db, AssetPrice, _to_records(df, PRICE_RECORD_COLUMNS))
 
         db.commit()
         logger.info(f"Inserted {records_inserted} asset price records")
@@ -124,17 +151,7 @@ class IngestionService:
             return 0
 
         # Insert into database
-        records_inserted = 0
-        for _, row in df.iterrows():
-            indicator = EconomicIndicator(
-                indicator_code=row["indicator_code"],
-                indicator_name=row["indicator_name"],
-                date=row["date"],
-                value=row["value"],
-                frequency=row.get("frequency"),
-            )
-            db.add(indicator)
-            records_inserted += 1
+        records_inserted = _bulk_insert(db, EconomicIndicator, _to_records(df, INDICATOR_RECORD_COLUMNS))
 
         db.commit()
         logger.info(f"Inserted {records_inserted} economic indicator records")
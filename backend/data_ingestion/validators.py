@@ -5,9 +5,52 @@ from typing import List, Tuple
 
 import numpy as np
 import pandas as pd
+from scipy.stats import zscore
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    NUMBA_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Explicit numeric dtypes for OHLCV frames so validation stays on NumPy fast paths
+PRICE_COLUMN_DTYPES = {
+    "open": np.float64,
+    "high": np.float64,
+    "low": np.float64,
+    "close": np.float64,
+    "volume": np.float64,
+    "adjusted_close": np.float64,
+}
+
+# Maximum number of offending row positions listed in a validation error
+MAX_REPORTED_ROWS = 10
+
+# Frames with at least this many rows use the fused Numba OHLC kernel when available
+NUMBA_MIN_ROWS = 100_000
+
+
+def _ohlc_violations_numpy(prices: np.ndarray) -> np.ndarray:
+    """Flag rows of an (n, 4) open/high/low/close array whose high/low do not bound the others."""
+    open_, high, low, close = prices.T
+    return (high < low) | (high < open_) | (high < close) | (low > open_) | (low > close)
+
+
+if NUMBA_AVAILABLE:
+    # No fastmath: NaN prices must compare False exactly as in the NumPy expression
+    @njit(parallel=True, cache=True)
+    def _ohlc_violations_numba(prices: np.ndarray) -> np.ndarray:
+        """Fused single-pass version of _ohlc_violations_numpy for C-contiguous float64 input."""
+        n = prices.shape[0]
+        out = np.empty(n, dtype=np.bool_)
+        for i in prange(n):
+            o, h, lo, c = prices[i, 0], prices[i, 1], prices[i, 2], prices[i, 3]
+            out[i] = h < lo or h < o or h < c or lo > o or lo > c
+        return out
+
 
 class DataValidator:
     """Validates data quality and consistency."""
@@ -23,8 +66,12 @@ class DataValidator:
         Returns:
             Tuple of (is_valid, list of problematic columns)
         """
-        missing_ratio = df.isnull().sum() / len(df)
-        problematic_cols = missing_ratio[missing_ratio > threshold].index.tolist()
+        if df.empty:
+            return True, []
+
+        # One reduction over the whole null mask instead of a per-column pass
+        missing_ratio = df.isna().to_numpy().mean(axis=0)
+        problematic_cols = df.columns[missing_ratio > threshold].tolist()
 
         if problematic_cols:
             logger.warning(f"Columns with >{threshold*100}% missing values: {problematic_cols}")
@@ -43,7 +90,14 @@ class DataValidator:
         Returns:
             Tuple of (has_no_duplicates, number of duplicates)
         """
-        duplicates = df.duplicated(subset=subset).sum()
+        if df.empty:
+            return True, 0
+
+        # Every row beyond the first in each key group is a duplicate; counting groups
+        # takes a single hash-table pass without materializing a boolean mask. observed=True
+        # keeps unobserved categorical combinations out of the group count.
+        keys = list(subset) if subset is not None else df.columns.tolist()
+        duplicates = len(df) - df.groupby(keys, sort=False, dropna=False, observed=True).ngroups
 
         if duplicates > 0:
             logger.warning(f"Found {duplicates} duplicate rows")
@@ -98,24 +152,24 @@ class DataValidator:
             logger.error(f"Column '{column}' not found")
             return True, pd.Series([False] * len(df))
 
-        values = df[column].dropna()
+        values = df[column].to_numpy(dtype=np.float64)
 
         if method == "iqr":
-            Q1 = values.quantile(0.25)
-            Q3 = values.quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - threshold * IQR
-            upper_bound = Q3 + threshold * IQR
-            outliers = (df[column] < lower_bound) | (df[column] > upper_bound)
+            # Both quartiles from one NaN-aware quantile call
+            q1, q3 = np.nanquantile(values, [0.25, 0.75])
+            iqr = q3 - q1
+            mask = (values < q1 - threshold * iqr) | (values > q3 + threshold * iqr)
 
         elif method == "zscore":
-            z_scores = np.abs((values - values.mean()) / values.std())
-            outliers = z_scores > threshold
+            # Sample standard deviation (ddof=1) as in pandas; missing values get a NaN score and never flag
+            z_scores = zscore(values, ddof=1, nan_policy="omit")
+            mask = np.abs(z_scores) > threshold
 
         else:
             logger.error(f"Unknown method: {method}")
             return True, pd.Series([False] * len(df))
 
+        outliers = pd.Series(mask, index=df.index)
         outlier_count = outliers.sum()
         if outlier_count > 0:
             logger.info(f"Found {outlier_count} outliers in '{column}' using {method} method")
@@ -142,20 +196,23 @@ class DataValidator:
             errors.append(f"Missing required columns: {missing_cols}")
             return False, errors
 
-        # Check for negative prices
-        for col in required_cols:
-            if (df[col] < 0).any():
-                errors.append(f"Negative values found in '{col}'")
-
-        # Check OHLC relationships
-        if not ((df["high"] >= df["low"]).all()):
-            errors.append("High price is less than low price in some rows")
-
-        if not ((df["high"] >= df["open"]).all() and (df["high"] >= df["close"]).all()):
-            errors.append("High price is less than open/close in some rows")
+        # Work on one typed (rows, 4) array instead of per-column Series
+        prices = np.ascontiguousarray(df[required_cols].to_numpy(dtype=np.float64))
 
-        if not ((df["low"] <= df["open"]).all() and (df["low"] <= df["close"]).all()):
-            errors.append("Low price is greater than open/close in some rows")
+        # Check for negative prices
+        negative = prices < 0
+        if negative.any():
+            negative_cols = [col for col, flag in zip(required_cols, negative.any(axis=0)) if flag]
+            negative_rows = np.flatnonzero(negative.any(axis=1))[:MAX_REPORTED_ROWS].tolist()
+            errors.append(f"Negative values found in {negative_cols} at rows {negative_rows}")
+
+        # Check OHLC relationships: high must bound open/close/low from above, low from below
+        if NUMBA_AVAILABLE and len(prices) >= NUMBA_MIN_ROWS:
+            violations = _ohlc_violations_numba(prices)
+        else:
+            violations = _ohlc_violations_numpy(prices)
+        if violations.any():
+            errors.append(f"OHLC violation at rows {np.flatnonzero(violations)[:MAX_REPORTED_ROWS].tolist()}")
 
         # Check for zero volume (if volume exists)
         if "volume" in df.columns:
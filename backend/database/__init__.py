@@ -2,6 +2,7 @@
 
 from .connection import DatabaseManager, get_db, get_db_manager
 from .models import AssetMetadata, AssetPrice, Base, EconomicIndicator
+from .statistics import fetch_return_statistics
 
 __all__ = [
     "Base",
@@ -11,4 +12,5 @@ __all__ = [
     "DatabaseManager",
     "get_db_manager",
     "get_db",
+    "fetch_return_statistics",
 ]
@@ -0,0 +1,124 @@
+"""SQL-side aggregation of return statistics."""
+
+import logging
+from typing import Dict, List
+
+import numpy as np
+from sqlalchemy import distinct, func, select
+from sqlalchemy.orm import Session, aliased
+
+from backend.database.models import AssetPrice
+
+logger = logging.getLogger(__name__)
+
+
+def fetch_return_statistics(db: Session, tickers: List[str], start_date: str, end_date: str) -> Dict:
+    """Compute daily return moments for a set of tickers inside the database.
+
+    Daily simple returns are derived with a LAG window per ticker on the combined calendar
+    of all tickers, with the semantics of forward filling the wide price frame before
+    pct_change and dropna: a day a ticker misses counts as a zero return for it, the next
+    return spans the gap, and dates before the latest first observation are dropped. Only
+    the sufficient statistics (count, per-ticker sums and pairwise sums of products) are
+    transferred, so the payload is O(N^2) in the number of tickers rather than O(N * days).
+
+    Args:
+        db: Database session
+        tickers: List of ticker symbols
+        start_date: Start date for historical data
+        end_date: End date for historical data
+
+    Returns:
+        Dictionary with:
+            - 'tickers': Tickers with data, sorted
+            - 'num_observations': Number of aligned return observations
+            - 'mean': 1D array of mean daily returns
+            - 'covariance': 2D sample covariance matrix of daily returns
+            - 'last_prices': Dict of ticker -> last close price in the range
+    """
+    in_range = (
+        AssetPrice.ticker.in_(tickers),
+        AssetPrice.date >= start_date,
+        AssetPrice.date <= end_date,
+    )
+
+    # Number the trading days of the combined calendar (the index of the pivoted price frame)
+    ranked = (
+        select(
+            AssetPrice.ticker,
+            AssetPrice.close,
+            func.dense_rank().over(order_by=AssetPrice.date).label("day"),
+        )
+        .where(*in_range)
+        .cte("ranked_prices")
+    )
+
+    # A ticker's previous own close is its forward-filled close on the previous calendar day,
+    # so LAG per ticker gives the padded return on every day the ticker trades
+    prev_close = func.lag(ranked.c.close).over(partition_by=ranked.c.ticker, order_by=ranked.c.day)
+    daily = select(ranked.c.ticker, ranked.c.day, (ranked.c.close / prev_close - 1.0).label("ret")).cte("daily_returns")
+
+    # dropna keeps the calendar days after every ticker's first observation
+    first_days = select(func.min(ranked.c.day).label("day")).group_by(ranked.c.ticker).subquery()
+    cutoff = select(func.max(first_days.c.day)).scalar_subquery()
+    num_observations = db.execute(select(func.count(distinct(ranked.c.day))).where(ranked.c.day > cutoff)).scalar()
+
+    # Days a ticker misses carry a zero padded return and contribute nothing to the sums
+    aligned = select(daily.c.ticker, daily.c.day, daily.c.ret).where(daily.c.day > cutoff).cte("aligned_returns")
+
+    a = aliased(aligned)
+    b = aliased(aligned)
+    pair_query = (
+        select(
+            a.c.ticker,
+            b.c.ticker,
+            func.sum(a.c.ret),
+            func.sum(a.c.ret * b.c.ret),
+        )
+        .join(b, a.c.day == b.c.day)
+        .where(a.c.ticker <= b.c.ticker)
+        .group_by(a.c.ticker, b.c.ticker)
+    )
+    rows = db.execute(pair_query).all()
+
+    # Last close per ticker
+    last_date = (
+        select(AssetPrice.ticker, func.max(AssetPrice.date).label("date"))
+        .where(*in_range)
+        .group_by(AssetPrice.ticker)
+        .subquery()
+    )
+    last_query = select(AssetPrice.ticker, AssetPrice.close).join(
+        last_date, (AssetPrice.ticker == last_date.c.ticker) & (AssetPrice.date == last_date.c.date)
+    )
+    last_prices = {ticker: close for ticker, close in db.execute(last_query).all()}
+
+    present = sorted(last_prices)
+    index = {ticker: i for i, ticker in enumerate(present)}
+    n_assets = len(present)
+
+    sums = np.zeros(n_assets)
+    cross = np.zeros((n_assets, n_assets))
+    for ticker_a, ticker_b, sum_a, sum_ab in rows:
+        i, j = index[ticker_a], index[ticker_b]
+        if i == j:
+            sums[i] = sum_a
+        cross[i, j] = cross[j, i] = sum_ab
+
+    if num_observations < 2:
+        raise ValueError(
+            f"Not enough aligned return observations for {', '.join(tickers)} between {start_date} and {end_date}"
+        )
+
+    mean = sums / num_observations
+    covariance = (cross - num_observations * np.outer(mean, mean)) / (num_observations - 1)
+
+    logger.info(f"Fetched return statistics for {n_assets} tickers over {num_observations} observations")
+
+    return {
+        "tickers": present,
+        "num_observations": num_observations,
+        "mean": mean,
+        "covariance": covariance,
+        "last_prices": {ticker: last_prices[ticker] for ticker in present},
+    }
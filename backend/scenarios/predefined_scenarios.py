@@ -1,6 +1,26 @@
 """Predefined stress scenarios based on historical events."""
 
-from typing import Dict, List
+import functools
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Recursively turn read-only mappings back into dicts and tuples into lists."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
 
 
 class PredefinedScenarios:
@@ -242,30 +262,49 @@ class PredefinedScenarios:
         }
 
     @staticmethod
-    def get_all_scenarios() -> List[Dict]:
+    @functools.lru_cache(maxsize=1)
+    def get_all_scenarios() -> Tuple[Mapping, ...]:
         """Get all predefined scenarios.
 
+        The scenarios are built once and shared between callers, so they are returned as
+        read-only mappings (lists become tuples); use to_dict() for a mutable copy.
+
+        Returns:
+            Tuple of all predefined scenario mappings
+        """
+        return tuple(
+            _freeze(scenario)
+            for scenario in (
+                PredefinedScenarios.get_2008_financial_crisis(),
+                PredefinedScenarios.get_covid19_crash(),
+                PredefinedScenarios.get_interest_rate_shock(),
+                PredefinedScenarios.get_oil_price_shock(),
+                PredefinedScenarios.get_volatility_spike(),
+                PredefinedScenarios.get_currency_crisis(),
+            )
+        )
+
+    @staticmethod
+    def to_dict(scenario: Mapping) -> Dict:
+        """Get a mutable deep copy of a predefined scenario.
+
+        Args:
+            scenario: Scenario mapping from get_all_scenarios() or get_scenario_by_name()
+
         Returns:
-            List of all predefined scenario dictionaries
+            Scenario dictionary with plain dicts and lists
         """
-        return [
-            PredefinedScenarios.get_2008_financial_crisis(),
-            PredefinedScenarios.get_covid19_crash(),
-            PredefinedScenarios.get_interest_rate_shock(),
-            PredefinedScenarios.get_oil_price_shock(),
-            PredefinedScenarios.get_volatility_spike(),
-            PredefinedScenarios.get_currency_crisis(),
-        ]
+        return _thaw(scenario)
 
     @staticmethod
-    def get_scenario_by_name(name: str) -> Dict:
+    def get_scenario_by_name(name: str) -> Mapping:
         """Get a specific predefined scenario by name.
 
         Args:
             name: Scenario name
 
         Returns:
-            Scenario dictionary
+            Read-only scenario mapping
 
         Raises:
             ValueError: If scenario name not found
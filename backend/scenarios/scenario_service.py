@@ -196,7 +196,7 @@ class ScenarioService:
         predefined = PredefinedScenarios.get_all_scenarios()
         loaded_count = 0
 
-        for scenario_dict in predefined:
+        for scenario_dict in map(PredefinedScenarios.to_dict, predefined):
             # Check if already exists
             existing = self.get_scenario_by_name(scenario_dict["name"])
             if existing:
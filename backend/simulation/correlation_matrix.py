@@ -5,6 +5,7 @@ from typing import Dict, List
 
 import numpy as np
 import pandas as pd
+from scipy.linalg import cholesky as scipy_cholesky
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
@@ -17,6 +18,13 @@ class CorrelationMatrix:
         """Initialize correlation matrix calculator."""
         self.correlation_matrix = None
         self.tickers = []
+        self._cholesky_cache = None
+        self._cholesky_key = None
+
+    def invalidate(self):
+        """Drop the cached Cholesky factor so the next request recomputes it."""
+        self._cholesky_cache = None
+        self._cholesky_key = None
 
     def calculate_from_returns(self, returns_df: pd.DataFrame, method: str = "pearson") -> pd.DataFrame:
         """Calculate correlation matrix from returns data.
@@ -35,6 +43,7 @@ class CorrelationMatrix:
 
         self.correlation_matrix = corr_matrix
         self.tickers = list(corr_matrix.columns)
+        self.invalidate()
 
         logger.info(f"Correlation matrix calculated: {corr_matrix.shape}")
         return corr_matrix
@@ -101,23 +110,34 @@ class CorrelationMatrix:
         """Get Cholesky decomposition of correlation matrix.
 
         Used for generating correlated random variables in Monte Carlo simulation.
+        The factor is cached and only recomputed when the correlation matrix changes.
 
         Returns:
-            Lower triangular Cholesky matrix
+            Lower triangular Cholesky matrix (read-only)
         """
         if self.correlation_matrix is None:
             raise ValueError("Correlation matrix not calculated yet")
 
+        values = np.ascontiguousarray(self.correlation_matrix.values)
+        key = (values.shape, hash(values.tobytes()))
+        if self._cholesky_key == key:
+            return self._cholesky_cache
+
+        # values may share memory with the DataFrame, so it is never overwritten; the finiteness scan is
+        # skipped because correlations of finite returns are finite
         try:
-            cholesky = np.linalg.cholesky(self.correlation_matrix.values)
+            cholesky = scipy_cholesky(values, lower=True, check_finite=False)
             logger.info("Cholesky decomposition calculated successfully")
-            return cholesky
         except np.linalg.LinAlgError:
             logger.warning("Correlation matrix is not positive definite, using eigenvalue adjustment")
             # Adjust matrix to be positive definite
-            adjusted_matrix = self._make_positive_definite(self.correlation_matrix.values)
-            cholesky = np.linalg.cholesky(adjusted_matrix)
-            return cholesky
+            adjusted_matrix = self._make_positive_definite(values)
+            cholesky = scipy_cholesky(adjusted_matrix, lower=True, overwrite_a=True, check_finite=False)
+
+        cholesky.flags.writeable = False
+        self._cholesky_cache = cholesky
+        self._cholesky_key = key
+        return cholesky
 
     def _make_positive_definite(self, matrix: np.ndarray, epsilon: float = 1e-6) -> np.ndarray:
         """Make a matrix positive definite by adjusting eigenvalues.
@@ -205,4 +225,5 @@ class CorrelationMatrix:
         """
         self.correlation_matrix = pd.read_csv(filepath, index_col=0)
         self.tickers = list(self.correlation_matrix.columns)
+        self.invalidate()
         logger.info(f"Correlation matrix loaded from {filepath}")
@@ -7,7 +7,7 @@ import numpy as np
 import pandas as pd
 from sqlalchemy.orm import Session
 
-from backend.database import AssetPrice
+from backend.database import AssetPrice, fetch_return_statistics
 from backend.simulation.correlation_matrix import CorrelationMatrix
 from backend.simulation.historical_simulation import HistoricalSimulation
 from backend.simulation.monte_carlo import MonteCarloSimulation
@@ -81,13 +81,13 @@ class SimulationEngine:
         combined_df = pd.concat(all_data, ignore_index=True)
         price_df = combined_df.pivot(index="date", columns="ticker", values="close")
 
-        # Calculate returns
-        returns_df = price_df.pct_change().dropna()
+        # Calculate returns (forward fill explicitly: pandas 3 no longer pads inside pct_change)
+        returns_df = price_df.ffill().pct_change().dropna()
 
-        # Calculate statistics
-        initial_prices = {ticker: price_df[ticker].iloc[-1] for ticker in tickers}
-        expected_returns = {ticker: returns_df[ticker].mean() * 252 for ticker in tickers}  # Annualized
-        volatilities = {ticker: returns_df[ticker].std() * np.sqrt(252) for ticker in tickers}  # Annualized
+        # Calculate statistics (column-wise reductions, keyed in the same column order as the correlation matrix)
+        initial_prices = price_df.iloc[-1].to_dict()
+        expected_returns = returns_df.mean().mul(252).to_dict()  # Annualized
+        volatilities = returns_df.std().mul(np.sqrt(252)).to_dict()  # Annualized
 
         # Calculate correlation matrix
         correlation_matrix = self.correlation_calculator.calculate_from_returns(returns_df)
@@ -102,6 +102,48 @@ class SimulationEngine:
             "tickers": tickers,
         }
 
+    def prepare_simulation_stats(self, tickers: List[str], start_date: str, end_date: str) -> Dict:
+        """Prepare Monte Carlo inputs from return statistics aggregated in the database.
+
+        Unlike prepare_simulation_data, raw price history is never transferred: only
+        per-ticker sums, pairwise cross-products and the last close price are fetched.
+
+        Args:
+            tickers: List of ticker symbols
+            start_date: Start date for historical data
+            end_date: End date for historical data
+
+        Returns:
+            Dictionary with initial prices, annualized returns/volatilities and correlation matrix
+        """
+        logger.info(f"Preparing simulation statistics for {len(tickers)} tickers")
+
+        if not tickers:
+            raise ValueError("At least one ticker is required")
+
+        if start_date >= end_date:
+            raise ValueError(f"start_date ({start_date}) must be before end_date ({end_date})")
+
+        stats = fetch_return_statistics(self.db, tickers, start_date, end_date)
+        present = stats["tickers"]
+
+        missing_tickers = [t for t in tickers if t not in stats["last_prices"]]
+        if missing_tickers:
+            logger.warning(f"No data found for tickers: {', '.join(missing_tickers)}")
+
+        # Annualize and convert covariance to correlation
+        daily_std = np.sqrt(np.diag(stats["covariance"]))
+        correlation_matrix = stats["covariance"] / np.outer(daily_std, daily_std)
+        np.fill_diagonal(correlation_matrix, 1.0)
+
+        return {
+            "initial_prices": stats["last_prices"],
+            "expected_returns": dict(zip(present, (stats["mean"] * 252).tolist())),
+            "volatilities": dict(zip(present, (daily_std * np.sqrt(252)).tolist())),
+            "correlation_matrix": correlation_matrix,
+            "tickers": tickers,
+        }
+
     def run_monte_carlo(
         self,
         tickers: List[str],
@@ -131,8 +173,8 @@ class SimulationEngine:
         """
         logger.info(f"Running Monte Carlo simulation for {len(tickers)} assets")
 
-        # Prepare data
-        data = self.prepare_simulation_data(tickers, start_date, end_date)
+        # Prepare data (Monte Carlo only needs moments, so aggregate them in the database)
+        data = self.prepare_simulation_stats(tickers, start_date, end_date)
 
         # Apply scenario adjustments if provided
         if scenario_adjustments:
@@ -3,6 +3,8 @@
 import logging
 from typing import Dict, List
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +21,12 @@ class HedgingService:
         self.tickers = tickers
         self.initial_total_value = initial_total_value
 
+        # Scratch buffers reused across calculate_trades calls (e.g. rolling rebalances on a fixed universe)
+        self._tickers_arr = np.array(tickers)
+        self._current_buf = np.zeros(len(tickers))
+        self._target_buf = np.zeros(len(tickers))
+        self._diff_buf = np.zeros(len(tickers))
+
     def calculate_trades(self, current_weights: Dict[str, float], target_weights: Dict[str, float]) -> List[Dict]:
         """Calculate necessary trades to go from current to target weights.
 
@@ -29,31 +37,34 @@ class HedgingService:
         Returns:
             List of trade dictionaries with ticker, action, percentage, and value
         """
-        trades = []
-
-        for ticker in self.tickers:
-            current = current_weights.get(ticker, 0.0)
-            target = target_weights.get(ticker, 0.0)
-            diff = target - current
-
-            if abs(diff) < 0.001:  # Ignore tiny changes
-                continue
-
-            action = "BUY" if diff > 0 else "SELL"
-            dollar_value = abs(diff) * self.initial_total_value
-
-            trades.append(
-                {
-                    "ticker": ticker,
-                    "action": action,
-                    "weight_change": abs(diff),
-                    "dollar_value": dollar_value,
-                    "target_weight": target,
-                }
+        current, target, diff = self._current_buf, self._target_buf, self._diff_buf
+        for i, ticker in enumerate(self.tickers):
+            current[i] = current_weights.get(ticker, 0.0)
+            target[i] = target_weights.get(ticker, 0.0)
+        np.subtract(target, current, out=diff)
+
+        # Ignore tiny changes
+        keep = np.flatnonzero(np.abs(diff) >= 0.001)
+
+        # Sort trades: SELLs first (to generate cash), then BUYs; stable keeps ticker order within each side
+        keep = keep[np.argsort(diff[keep] > 0, kind="stable")]
+
+        actions = np.where(diff[keep] > 0, "BUY", "SELL")
+        weight_changes = np.abs(diff[keep])
+        dollar_values = weight_changes * self.initial_total_value
+
+        return [
+            {
+                "ticker": str(ticker),
+                "action": str(action),
+                "weight_change": float(change),
+                "dollar_value": float(value),
+                "target_weight": float(weight),
+            }
+            for ticker, action, change, value, weight in zip(
+                self._tickers_arr[keep], actions, weight_changes, dollar_values, target[keep]
             )
-
-        # Sort trades: SELLs first (to generate cash), then BUYs
-        return sorted(trades, key=lambda x: 1 if x["action"] == "BUY" else 0)
+        ]
 
     def generate_recommendations(self, optimization_result: Dict) -> Dict:
         """Generate recommendations for Max Sharpe and Min Volatility portfolios.
@@ -5,12 +5,17 @@ from typing import Dict, List, Optional
 
 import numpy as np
 import pandas as pd
+from scipy.stats import kurtosis, skew
 from sqlalchemy.orm import Session
 
 from backend.database import AssetPrice
+from backend.simulation.utils import asset_var_cvar, tail_var_cvar, workspace_view
 
 logger = logging.getLogger(__name__)
 
+# Number of paths sampled per chunk when only terminal prices are needed
+SIMULATION_CHUNK_SIZE = 1024
+
 
 class HistoricalSimulation:
     """Historical simulation using bootstrap resampling of historical returns."""
@@ -24,8 +29,14 @@ class HistoricalSimulation:
         """
         self.historical_returns = historical_returns
         self.tickers = list(historical_returns.columns)
+
+        # Asset-major contiguous copy so bootstrap draws are a single fancy-index gather
+        self._returns_array = np.ascontiguousarray(historical_returns.to_numpy(dtype=np.float64).T)
         self.initial_prices = np.array([initial_prices[t] for t in self.tickers])
 
+        # Reciprocal prices turn per-path price ratios into multiplications
+        self._inv_initial_prices = 1.0 / self.initial_prices
+
         logger.info(f"Initialized historical simulation with {len(historical_returns)} historical periods")
 
     @classmethod
@@ -89,6 +100,8 @@ class HistoricalSimulation:
         num_days: int = 252,
         block_size: int = 1,
         random_seed: Optional[int] = None,
+        return_paths: bool = False,
+        out: Optional[np.ndarray] = None,
     ) -> Dict[str, np.ndarray]:
         """Run historical simulation using bootstrap resampling.
 
@@ -97,87 +110,107 @@ class HistoricalSimulation:
             num_days: Number of time steps to simulate
             block_size: Block size for block bootstrap (1 = standard bootstrap)
             random_seed: Random seed for reproducibility
+            return_paths: If True, also return full price and return paths
+            out: Optional preallocated C-contiguous buffer the sampled returns are gathered into;
+                with return_paths, 'returns' is a view into it and is overwritten by the next
+                call sharing the buffer
 
         Returns:
             Dictionary with simulation results:
-                - 'prices': 3D array (num_assets, num_simulations, num_days)
-                - 'returns': 3D array of returns
                 - 'final_prices': 2D array (num_assets, num_simulations)
+                - 'prices': 3D array (num_assets, num_simulations, num_days + 1), only if return_paths
+                - 'returns': 3D array of returns, only if return_paths
         """
-        if random_seed is not None:
-            np.random.seed(random_seed)
+        rng = np.random.default_rng(random_seed)
 
         logger.info(f"Running {num_simulations} historical simulations for {num_days} days")
 
-        num_assets = len(self.tickers)
-        num_historical_periods = len(self.historical_returns)
-
-        # Initialize price paths
-        prices = np.zeros((num_assets, num_simulations, num_days + 1))
-        prices[:, :, 0] = self.initial_prices[:, np.newaxis]
+        if return_paths:
+            simulated_returns = self._sample_returns(num_simulations, num_days, block_size, rng, out)
 
-        # Initialize returns array
-        simulated_returns = np.zeros((num_assets, num_simulations, num_days))
+            # Calculate full price paths from returns
+            prices = np.empty((len(self.tickers), num_simulations, num_days + 1))
+            prices[:, :, 0] = self.initial_prices[:, np.newaxis]
+            np.cumprod(1 + simulated_returns, axis=2, out=prices[:, :, 1:])
+            prices[:, :, 1:] *= self.initial_prices[:, np.newaxis, np.newaxis]
 
-        if block_size == 1:
-            # Standard bootstrap: sample individual days
-            for sim in range(num_simulations):
-                # Randomly sample days from historical returns
-                sampled_indices = np.random.randint(0, num_historical_periods, size=num_days)
-                sampled_returns = self.historical_returns.iloc[sampled_indices].values.T
-                simulated_returns[:, sim, :] = sampled_returns
+            results = {
+                "prices": prices,
+                "returns": simulated_returns,
+                "final_prices": prices[:, :, -1],
+                "tickers": self.tickers,
+            }
         else:
-            # Block bootstrap: sample blocks of consecutive days
-            for sim in range(num_simulations):
-                sampled_returns = self._block_bootstrap(num_days, block_size, num_historical_periods)
-                simulated_returns[:, sim, :] = sampled_returns
-
-        # Calculate price paths from returns
-        for t in range(num_days):
-            prices[:, :, t + 1] = prices[:, :, t] * (1 + simulated_returns[:, :, t])
-
-        results = {
-            "prices": prices,
-            "returns": simulated_returns,
-            "final_prices": prices[:, :, -1],
-            "tickers": self.tickers,
-        }
+            # Only terminal values are needed: sample in chunks of paths so the working set stays cache-sized
+            final_prices = np.empty((len(self.tickers), num_simulations))
+            for start in range(0, num_simulations, SIMULATION_CHUNK_SIZE):
+                stop = min(start + SIMULATION_CHUNK_SIZE, num_simulations)
+                chunk_returns = self._sample_returns(stop - start, num_days, block_size, rng, out)
+                chunk_returns += 1
+                np.prod(chunk_returns, axis=2, out=final_prices[:, start:stop])
+            final_prices *= self.initial_prices[:, np.newaxis]
+
+            results = {"final_prices": final_prices, "tickers": self.tickers}
 
         logger.info("Historical simulation completed")
         return results
 
-    def _block_bootstrap(self, num_days: int, block_size: int, num_historical_periods: int) -> np.ndarray:
-        """Perform block bootstrap resampling.
+    def _sample_returns(
+        self,
+        num_simulations: int,
+        num_days: int,
+        block_size: int,
+        rng: np.random.Generator,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Bootstrap a block of simulated return paths.
 
         Args:
-            num_days: Number of days to simulate
-            block_size: Size of each block
-            num_historical_periods: Total number of historical periods
+            num_simulations: Number of simulation paths to sample
+            num_days: Number of time steps per path
+            block_size: Block size for block bootstrap (1 = standard bootstrap)
+            rng: Random generator to sample with
+            out: Optional buffer to gather the sampled returns into
 
         Returns:
-            Sampled returns array (num_assets, num_days)
+            Sampled returns array (num_assets, num_simulations, num_days)
         """
-        sampled_returns = []
-        days_sampled = 0
+        num_historical_periods = self._returns_array.shape[1]
+
+        if block_size == 1 or num_historical_periods - block_size <= 0:
+            # Standard bootstrap: sample individual days (also the fallback when blocks exceed the history)
+            sampled_indices = rng.integers(0, num_historical_periods, size=(num_simulations, num_days))
+        else:
+            sampled_indices = self._block_indices(num_simulations, num_days, block_size, num_historical_periods, rng)
 
-        while days_sampled < num_days:
-            # Randomly select a starting point for the block
-            max_start = num_historical_periods - block_size
-            if max_start <= 0:
-                # If block size is larger than historical data, use standard bootstrap
-                start_idx = np.random.randint(0, num_historical_periods)
-                block = self.historical_returns.iloc[start_idx : start_idx + 1].values.T
-            else:
-                start_idx = np.random.randint(0, max_start)
-                block = self.historical_returns.iloc[start_idx : start_idx + block_size].values.T
+        if out is None:
+            return self._returns_array[:, sampled_indices]
 
-            sampled_returns.append(block)
-            days_sampled += block.shape[1]
+        shape = (self._returns_array.shape[0], num_simulations, num_days)
+        # Indices are always in range; mode="clip" lets take() write straight into out without buffering
+        view = workspace_view(out, shape, self._returns_array.dtype)
+        return np.take(self._returns_array, sampled_indices, axis=1, out=view, mode="clip")
 
-        # Concatenate and trim to exact length
-        all_returns = np.concatenate(sampled_returns, axis=1)[:, :num_days]
+    @staticmethod
+    def _block_indices(
+        num_simulations: int, num_days: int, block_size: int, num_historical_periods: int, rng: np.random.Generator
+    ) -> np.ndarray:
+        """Build block bootstrap row indices for every path at once.
 
-        return all_returns
+        Args:
+            num_simulations: Number of simulation paths
+            num_days: Number of days to simulate
+            block_size: Size of each block
+            num_historical_periods: Total number of historical periods
+            rng: Random generator to draw block start points from
+
+        Returns:
+            Index array (num_simulations, num_days) of consecutive-day blocks, trimmed to num_days
+        """
+        num_blocks = -(-num_days // block_size)
+        starts = rng.integers(0, num_historical_periods - block_size, size=(num_simulations, num_blocks))
+        indices = starts[:, :, np.newaxis] + np.arange(block_size)
+        return indices.reshape(num_simulations, num_blocks * block_size)[:, :num_days]
 
     def calculate_statistics(self, results: Dict) -> pd.DataFrame:
         """Calculate summary statistics from simulation results.
@@ -225,32 +258,20 @@ class HistoricalSimulation:
             initial_portfolio_value: Initial portfolio value
 
         Returns:
-            Dictionary with VaR metrics
+            Dictionary with portfolio VaR metrics plus per-asset 'asset_var' and 'asset_cvar' by ticker
         """
         final_prices = results["final_prices"]
 
-        # Calculate portfolio values (assuming equal weights)
-        num_assets = len(self.tickers)
-        weight_per_asset = initial_portfolio_value / num_assets
+        # Equal-weight portfolio return for each simulation is the mean of the per-asset gross returns
+        portfolio_returns = self._inv_initial_prices @ final_prices / len(self.tickers) - 1.0
 
-        # Portfolio value for each simulation
-        portfolio_values = (
-            np.sum(
-                (final_prices / self.initial_prices[:, np.newaxis]) * (weight_per_asset / num_assets),
-                axis=0,
-            )
-            * num_assets
-        )
+        # VaR and CVaR (Conditional VaR / Expected Shortfall) from one partition of the tail
+        var, cvar = tail_var_cvar(portfolio_returns, confidence_level)
 
-        # Calculate returns
-        portfolio_returns = (portfolio_values - initial_portfolio_value) / initial_portfolio_value
-
-        # VaR calculation
-        var_percentile = (1 - confidence_level) * 100
-        var = np.percentile(portfolio_returns, var_percentile)
-
-        # CVaR (Conditional VaR / Expected Shortfall)
-        cvar = np.mean(portfolio_returns[portfolio_returns <= var])
+        # Per-asset VaR/CVaR for all tickers in one percentile call over the (assets, sims) returns
+        asset_var, asset_cvar = asset_var_cvar(
+            final_prices * self._inv_initial_prices[:, np.newaxis] - 1.0, confidence_level
+        )
 
         return {
             "var": var,
@@ -261,6 +282,8 @@ class HistoricalSimulation:
             "mean_return": np.mean(portfolio_returns),
             "std_return": np.std(portfolio_returns),
             "probability_loss": np.mean(portfolio_returns < 0),
+            "asset_var": dict(zip(self.tickers, asset_var.tolist())),
+            "asset_cvar": dict(zip(self.tickers, asset_cvar.tolist())),
         }
 
     def get_empirical_distribution(self, results: Dict, ticker: str) -> Dict:
@@ -292,12 +315,8 @@ class HistoricalSimulation:
 
     def _calculate_skewness(self, data: np.ndarray) -> float:
         """Calculate skewness of distribution."""
-        mean = np.mean(data)
-        std = np.std(data)
-        return np.mean(((data - mean) / std) ** 3)
+        return float(skew(data))
 
     def _calculate_kurtosis(self, data: np.ndarray) -> float:
         """Calculate kurtosis of distribution."""
-        mean = np.mean(data)
-        std = np.std(data)
-        return np.mean(((data - mean) / std) ** 4) - 3  # Excess kurtosis
+        return float(kurtosis(data))  # Excess kurtosis (Fisher)
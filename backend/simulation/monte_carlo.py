@@ -1,13 +1,100 @@
 """Monte Carlo simulation using Geometric Brownian Motion."""
 
 import logging
-from typing import Dict, Optional
+import os
+from typing import Dict, Optional, Union
 
 import numpy as np
 import pandas as pd
+from scipy.linalg import cholesky
+
+from backend.simulation.utils import (
+    asset_var_cvar,
+    lower_triangular_matmul,
+    make_positive_definite,
+    tail_var_cvar,
+    worker_process_pool,
+    workspace_view,
+)
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    NUMBA_AVAILABLE = False
+
+try:
+    import cupy as cp
+
+    CUPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    CUPY_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Average one-step return across assets below which a path is treated as stressed
+STRESS_RETURN_THRESHOLD = -0.015
+
+
+def _simulate_batch(simulation: "MonteCarloSimulation", kwargs: Dict) -> Dict[str, np.ndarray]:
+    """Run one independent batch of paths in a worker process.
+
+    Log returns are dropped unless full paths were requested so only small arrays are pickled back.
+    """
+    results = simulation.simulate(**kwargs)
+    if not kwargs["store_full_paths"]:
+        del results["returns"]
+    return results
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _simulate_regime_aware(
+        shocks: np.ndarray,
+        base_cholesky: np.ndarray,
+        stress_cholesky: np.ndarray,
+        drift: np.ndarray,
+        sigma_sqrt_dt: np.ndarray,
+        stress_threshold: float,
+    ) -> None:
+        """Turn independent shocks into regime-aware GBM log returns in place.
+
+        Paths are independent of each other, so simulations run in parallel; within a
+        path each step picks the base or stress Cholesky factor from the previous step's
+        average return.
+
+        Args:
+            shocks: Independent standard normal shocks (num_assets, num_simulations, num_days),
+                overwritten with log returns
+            base_cholesky: Lower Cholesky factor of the normal correlation matrix
+            stress_cholesky: Lower Cholesky factor of the stress correlation matrix
+            drift: Per-asset log drift per step
+            sigma_sqrt_dt: Per-asset volatility scaled by sqrt(dt)
+            stress_threshold: Average return below which the next step uses the stress factor
+        """
+        num_assets, num_simulations, num_days = shocks.shape
+        for s in prange(num_simulations):
+            correlated = np.empty(num_assets)
+            for t in range(num_days):
+                cholesky = base_cholesky
+                if t > 0:
+                    avg_prev_return = 0.0
+                    for a in range(num_assets):
+                        avg_prev_return += np.exp(shocks[a, s, t - 1]) - 1.0
+                    if avg_prev_return / num_assets < stress_threshold:
+                        cholesky = stress_cholesky
+
+                for a in range(num_assets):
+                    acc = 0.0
+                    for k in range(a + 1):
+                        acc += cholesky[a, k] * shocks[k, s, t]
+                    correlated[a] = acc
+
+                for a in range(num_assets):
+                    shocks[a, s, t] = drift[a] + sigma_sqrt_dt[a] * correlated[a]
+
 
 class MonteCarloSimulation:
     """Monte Carlo simulation for asset price paths using Geometric Brownian Motion."""
@@ -18,6 +105,8 @@ class MonteCarloSimulation:
         expected_returns: Dict[str, float],
         volatilities: Dict[str, float],
         correlation_matrix: Optional[np.ndarray] = None,
+        dtype: np.dtype = np.float32,
+        precomputed_cholesky: Optional[np.ndarray] = None,
     ):
         """Initialize Monte Carlo simulation.
 
@@ -26,13 +115,28 @@ class MonteCarloSimulation:
             expected_returns: Dictionary of ticker -> expected annual return (mu)
             volatilities: Dictionary of ticker -> annual volatility (sigma)
             correlation_matrix: Optional correlation matrix for correlated simulations
+            dtype: Floating point type for simulated paths (float32 halves memory traffic;
+                path noise dominates its rounding error)
+            precomputed_cholesky: Optional lower Cholesky factor of correlation_matrix, reused
+                instead of factoring it again (e.g. when many simulations share one matrix)
         """
+        self.dtype = np.dtype(dtype)
         self.tickers = list(initial_prices.keys())
-        self.initial_prices = np.array([initial_prices[t] for t in self.tickers])
-        self.expected_returns = np.array([expected_returns[t] for t in self.tickers])
-        self.volatilities = np.array([volatilities[t] for t in self.tickers])
+        self.initial_prices = np.array([initial_prices[t] for t in self.tickers], dtype=self.dtype)
+        self.expected_returns = np.array([expected_returns[t] for t in self.tickers], dtype=self.dtype)
+        self.volatilities = np.array([volatilities[t] for t in self.tickers], dtype=self.dtype)
         self.correlation_matrix = correlation_matrix
 
+        # Reciprocal prices turn per-path price ratios into multiplications
+        self._inv_initial_prices = 1.0 / self.initial_prices
+
+        # Factor once; C-contiguous in the simulation dtype so matmul dispatches straight to (s|d)gemm
+        self._base_cholesky = None
+        if correlation_matrix is not None:
+            if precomputed_cholesky is None:
+                precomputed_cholesky = cholesky(correlation_matrix, lower=True, check_finite=False)
+            self._base_cholesky = np.ascontiguousarray(precomputed_cholesky, dtype=self.dtype)
+
         logger.info(f"Initialized Monte Carlo simulation for {len(self.tickers)} assets")
 
     def simulate(
@@ -40,8 +144,13 @@ class MonteCarloSimulation:
         num_simulations: int = 1000,
         num_days: int = 252,
         dt: float = 1 / 252,
-        random_seed: Optional[int] = None,
+        random_seed: Optional[Union[int, np.random.SeedSequence]] = None,
         regime_aware: bool = False,
+        store_full_paths: bool = False,
+        num_sample_paths: int = 10,
+        device: str = "cpu",
+        num_workers: Optional[int] = 1,
+        out: Optional[np.ndarray] = None,
     ) -> Dict[str, np.ndarray]:
         """Run Monte Carlo simulation.
 
@@ -51,95 +160,322 @@ class MonteCarloSimulation:
             dt: Time step size (1/252 for daily with annual parameters)
             random_seed: Random seed for reproducibility
             regime_aware: If True, correlations increase during stress (convergence)
+            store_full_paths: If True, also return the full price tensor
+            num_sample_paths: Number of leading price paths kept for visualization
+            device: 'cpu', or 'cuda' to run constant-correlation simulations on the GPU with CuPy
+            num_workers: Number of processes for independent CPU batches (None uses every core).
+                Batches draw from SeedSequence(random_seed).spawn(num_workers), so a seeded run
+                is reproducible for a fixed num_workers but differs from the single-process stream.
+                Workers are spawned, so scripts must guard their entry point with __name__ == "__main__"
+            out: Optional preallocated C-contiguous buffer reused for the shock/log-return tensor
+                (single-process CPU runs only); 'returns' is then a view into it and is overwritten
+                by the next call sharing the buffer
 
         Returns:
-            Dictionary with simulation results
+            Dictionary with simulation results:
+                - 'returns': 3D array of log returns (num_assets, num_simulations, num_days),
+                  on 'cuda' or with several workers only if store_full_paths
+                - 'final_prices': 2D array (num_assets, num_simulations)
+                - 'sample_paths': 3D array of the first num_sample_paths price paths
+                - 'prices': 3D array (num_assets, num_simulations, num_days + 1), only if store_full_paths
         """
-        if random_seed is not None:
-            np.random.seed(random_seed)
+        if device not in ("cpu", "cuda"):
+            raise ValueError(f"Unknown device '{device}', expected 'cpu' or 'cuda'")
+        if device == "cuda":
+            if not CUPY_AVAILABLE:
+                raise RuntimeError("device='cuda' requires CuPy to be installed")
+            if regime_aware:
+                raise ValueError("Regime-aware simulation is path dependent and only runs on device='cpu'")
+
+        num_workers = min(num_workers or os.cpu_count() or 1, num_simulations)
+        if out is not None and (device != "cpu" or num_workers > 1):
+            raise ValueError("out is only supported for single-process runs on device='cpu'")
+        if device == "cpu" and num_workers > 1:
+            return self._simulate_parallel(
+                num_simulations,
+                num_workers,
+                num_days=num_days,
+                dt=dt,
+                random_seed=random_seed,
+                regime_aware=regime_aware,
+                store_full_paths=store_full_paths,
+                num_sample_paths=num_sample_paths,
+            )
+
+        rng = np.random.default_rng(random_seed)
 
-        logger.info(f"Running {num_simulations} simulations for {num_days} days (Regime-Aware: {regime_aware})")
+        logger.info(
+            f"Running {num_simulations} simulations for {num_days} days "
+            f"(Regime-Aware: {regime_aware}, device: {device})"
+        )
 
         num_assets = len(self.tickers)
 
-        # Initialize price paths
-        prices = np.zeros((num_assets, num_simulations, num_days + 1))
-        prices[:, :, 0] = self.initial_prices[:, np.newaxis]
+        # Keep every intermediate in the simulation dtype
+        dt = self.dtype.type(dt)
 
-        # Pre-calculate base Cholesky if needed
-        base_cholesky = None
+        # Pre-calculate stress Cholesky if needed
+        base_cholesky = self._base_cholesky
         stress_cholesky = None
-        if self.correlation_matrix is not None:
-            base_cholesky = np.linalg.cholesky(self.correlation_matrix)
+        if regime_aware and self.correlation_matrix is not None:
+            # Create a stress correlation matrix (correlations converge toward 1.0):
+            # push every off-diagonal correlation 30% closer to 1.0
+            corr = np.asarray(self.correlation_matrix, dtype=np.float64)
+            stress_corr = corr + 0.3 * (1.0 - corr)
+            np.fill_diagonal(stress_corr, 1.0)
+
+            # Ensure positive definite; the adjusted matrix is a fresh finite array, so skip the
+            # finiteness scan and factor it in place
+            stress_corr = make_positive_definite(stress_corr)
+            stress_cholesky = np.ascontiguousarray(
+                cholesky(stress_corr, lower=True, overwrite_a=True, check_finite=False), dtype=self.dtype
+            )
 
-            if regime_aware:
-                # Create a stress correlation matrix (correlations converge toward 1.0)
-                stress_corr = self.correlation_matrix.copy()
-                n = stress_corr.shape[0]
-                for i in range(n):
-                    for j in range(n):
-                        if i != j:
-                            # Push correlations 30% closer to 1.0
-                            stress_corr[i, j] = stress_corr[i, j] + (1.0 - stress_corr[i, j]) * 0.3
-
-                # Ensure positive definite
-                from backend.simulation.utils import make_positive_definite
-
-                stress_corr = make_positive_definite(stress_corr)
-                stress_cholesky = np.linalg.cholesky(stress_corr)
-
-        # Simulate price paths
-        for t in range(num_days):
-            # Generate shocks for this step
-            independent_shocks = np.random.normal(0, 1, (num_assets, num_simulations))
+        # Per-asset GBM step coefficients, invariant across days
+        drift = (self.expected_returns - 0.5 * self.volatilities**2) * dt
+        sigma_sqrt_dt = self.volatilities * np.sqrt(dt)
+
+        if device == "cuda":
+            return self._simulate_cuda(
+                num_simulations, num_days, drift, sigma_sqrt_dt, random_seed, store_full_paths, num_sample_paths
+            )
 
+        # Draw all independent shocks up front so both paths consume the same random stream
+        shape = (num_assets, num_simulations, num_days)
+        if out is None:
+            all_shocks = rng.standard_normal(shape, dtype=self.dtype)
+        else:
+            all_shocks = rng.standard_normal(dtype=self.dtype, out=workspace_view(out, shape, self.dtype))
+
+        if stress_cholesky is None:
+            # Constant correlation: every step is independent of the path so far, so the whole
+            # simulation is a cumulative sum of log increments
             if base_cholesky is not None:
-                if not regime_aware:
-                    # Constant correlation
-                    shocks = base_cholesky @ independent_shocks
-                else:
-                    # Dynamic correlation based on previous step performance
-                    # (Assume stress if portfolio return at t is < -1.5%)
-                    shocks = np.zeros_like(independent_shocks)
-
-                    # For t=0, use base
-                    if t == 0:
-                        shocks = base_cholesky @ independent_shocks
-                    else:
-                        # Calculate returns for the previous step across all simulations
-                        # (Simple average return as proxy for portfolio)
-                        prev_returns = (prices[:, :, t] / prices[:, :, t - 1]) - 1
-                        avg_prev_returns = np.mean(prev_returns, axis=0)
-
-                        stress_mask = avg_prev_returns < -0.015
-
-                        # Apply appropriate Cholesky
-                        shocks[:, ~stress_mask] = base_cholesky @ independent_shocks[:, ~stress_mask]
-                        shocks[:, stress_mask] = stress_cholesky @ independent_shocks[:, stress_mask]
+                flat_shocks = all_shocks.reshape(num_assets, num_simulations * num_days)
+                flat_shocks = lower_triangular_matmul(base_cholesky, flat_shocks, overwrite=True)
+                all_shocks = flat_shocks.reshape(num_assets, num_simulations, num_days)
+
+            # Scale and shift in place so the log returns reuse the shock buffer
+            all_shocks *= sigma_sqrt_dt[:, np.newaxis, np.newaxis]
+            all_shocks += drift[:, np.newaxis, np.newaxis]
+            returns = all_shocks
+        else:
+            # Path-dependent: each step's factor depends on the previous step's returns, which are
+            # written over the consumed shocks
+            if NUMBA_AVAILABLE:
+                _simulate_regime_aware(
+                    all_shocks,
+                    base_cholesky,
+                    stress_cholesky,
+                    drift,
+                    sigma_sqrt_dt,
+                    STRESS_RETURN_THRESHOLD,
+                )
             else:
-                shocks = independent_shocks
-
-            # Apply Geometric Brownian Motion step
-            drift = (self.expected_returns[:, np.newaxis] - 0.5 * self.volatilities[:, np.newaxis] ** 2) * dt
-            diffusion = self.volatilities[:, np.newaxis] * np.sqrt(dt) * shocks
+                self._simulate_regime_aware_numpy(all_shocks, base_cholesky, stress_cholesky, drift, sigma_sqrt_dt)
+            returns = all_shocks
 
-            prices[:, :, t + 1] = prices[:, :, t] * np.exp(drift + diffusion)
+        final_prices = self.initial_prices[:, np.newaxis] * np.exp(returns.sum(axis=2))
+        prices = self._price_paths(returns) if store_full_paths else None
 
-        # Calculate returns
-        returns = np.diff(np.log(prices), axis=2)
+        if prices is not None:
+            sample_paths = prices[:, :num_sample_paths, :].copy()
+        else:
+            sample_paths = self._price_paths(returns[:, :num_sample_paths, :])
 
         results = {
-            "prices": prices,
             "returns": returns,
-            "final_prices": prices[:, :, -1],
+            "final_prices": final_prices,
+            "sample_paths": sample_paths,
             "tickers": self.tickers,
         }
+        if store_full_paths:
+            results["prices"] = prices
 
         logger.info("Monte Carlo simulation completed")
         return results
 
+    def _simulate_parallel(
+        self,
+        num_simulations: int,
+        num_workers: int,
+        random_seed: Optional[Union[int, np.random.SeedSequence]],
+        store_full_paths: bool,
+        num_sample_paths: int,
+        **kwargs,
+    ) -> Dict[str, np.ndarray]:
+        """Split the paths into independent batches and simulate them in worker processes.
+
+        Args:
+            num_simulations: Total number of simulation paths
+            num_workers: Number of batches / worker processes
+            random_seed: Seed for the SeedSequence the batch streams are spawned from
+            store_full_paths: If True, also gather returns and the full price tensor
+            num_sample_paths: Number of leading price paths kept for visualization
+            **kwargs: Remaining simulate() arguments, passed to every batch
+
+        Returns:
+            Results dictionary in the same layout as simulate()
+        """
+        base, extra = divmod(num_simulations, num_workers)
+        batch_sizes = [base + (i < extra) for i in range(num_workers)]
+        seeds = np.random.SeedSequence(random_seed).spawn(num_workers)
+
+        logger.info(f"Running {num_simulations} simulations in {num_workers} worker processes")
+
+        batch_kwargs = [
+            dict(
+                kwargs,
+                num_simulations=size,
+                random_seed=seed,
+                store_full_paths=store_full_paths,
+                num_sample_paths=min(num_sample_paths, size),
+                num_workers=1,
+            )
+            for size, seed in zip(batch_sizes, seeds)
+        ]
+        with worker_process_pool(num_workers) as executor:
+            batches = list(executor.map(_simulate_batch, [self] * num_workers, batch_kwargs))
+
+        results = {
+            "final_prices": np.concatenate([batch["final_prices"] for batch in batches], axis=1),
+            "sample_paths": np.concatenate([batch["sample_paths"] for batch in batches], axis=1)[
+                :, :num_sample_paths, :
+            ],
+            "tickers": self.tickers,
+        }
+        if store_full_paths:
+            results["returns"] = np.concatenate([batch["returns"] for batch in batches], axis=1)
+            results["prices"] = np.concatenate([batch["prices"] for batch in batches], axis=1)
+
+        return results
+
+    def _simulate_cuda(
+        self,
+        num_simulations: int,
+        num_days: int,
+        drift: np.ndarray,
+        sigma_sqrt_dt: np.ndarray,
+        random_seed: Optional[int],
+        store_full_paths: bool,
+        num_sample_paths: int,
+    ) -> Dict[str, np.ndarray]:
+        """Run a constant-correlation simulation on the GPU with CuPy.
+
+        The shock and log-return tensors stay on the device; only final prices and the sample
+        paths' returns (plus the full tensors when store_full_paths) are copied back to the host.
+
+        Args:
+            num_simulations: Number of simulation paths
+            num_days: Number of time steps
+            drift: Per-asset log drift per step
+            sigma_sqrt_dt: Per-asset volatility scaled by sqrt(dt)
+            random_seed: Seed for the CuPy generator (streams differ from the CPU generator)
+            store_full_paths: If True, also copy back returns and the full price tensor
+            num_sample_paths: Number of leading price paths kept for visualization
+
+        Returns:
+            Results dictionary in the same layout as simulate()
+        """
+        num_assets = len(self.tickers)
+        rng = cp.random.default_rng(random_seed)
+
+        shocks = rng.standard_normal((num_assets, num_simulations, num_days), dtype=self.dtype)
+        if self._base_cholesky is not None:
+            cholesky = cp.asarray(self._base_cholesky)
+            shocks = (cholesky @ shocks.reshape(num_assets, -1)).reshape(num_assets, num_simulations, num_days)
+
+        returns = cp.asarray(drift)[:, None, None] + cp.asarray(sigma_sqrt_dt)[:, None, None] * shocks
+        del shocks
+        final_prices = cp.asarray(self.initial_prices)[:, None] * cp.exp(returns.sum(axis=2))
+
+        results = {
+            "final_prices": cp.asnumpy(final_prices),
+            "sample_paths": self._price_paths(cp.asnumpy(returns[:, :num_sample_paths, :])),
+            "tickers": self.tickers,
+        }
+        if store_full_paths:
+            results["returns"] = cp.asnumpy(returns)
+            results["prices"] = self._price_paths(results["returns"])
+
+        return results
+
+    def _price_paths(self, returns: np.ndarray) -> np.ndarray:
+        """Build price paths (including day 0) from log returns.
+
+        Args:
+            returns: Log returns (num_assets, num_paths, num_days)
+
+        Returns:
+            Price paths (num_assets, num_paths, num_days + 1)
+        """
+        num_assets, num_paths, num_days = returns.shape
+        paths = np.empty((num_assets, num_paths, num_days + 1), dtype=self.dtype)
+        paths[:, :, 0] = self.initial_prices[:, np.newaxis]
+        np.cumsum(returns, axis=2, out=paths[:, :, 1:])
+        np.exp(paths[:, :, 1:], out=paths[:, :, 1:])
+        paths[:, :, 1:] *= self.initial_prices[:, np.newaxis, np.newaxis]
+        return paths
+
+    def _simulate_regime_aware_numpy(
+        self,
+        all_shocks: np.ndarray,
+        base_cholesky: np.ndarray,
+        stress_cholesky: np.ndarray,
+        drift: np.ndarray,
+        sigma_sqrt_dt: np.ndarray,
+    ) -> None:
+        """Turn shocks into regime-aware log returns in place with a per-step NumPy loop (used without Numba).
+
+        Args:
+            all_shocks: Independent standard normal shocks (num_assets, num_simulations, num_days),
+                overwritten with log returns
+            base_cholesky: Lower Cholesky factor of the normal correlation matrix
+            stress_cholesky: Lower Cholesky factor of the stress correlation matrix
+            drift: Per-asset log drift per step
+            sigma_sqrt_dt: Per-asset volatility scaled by sqrt(dt)
+        """
+        num_days = all_shocks.shape[2]
+        drift_col = drift[:, np.newaxis]
+        sigma_sqrt_dt_col = sigma_sqrt_dt[:, np.newaxis]
+
+        # Simulate log returns
+        for t in range(num_days):
+            independent_shocks = all_shocks[:, :, t]
+
+            # Dynamic correlation based on previous step performance
+            # (Assume stress if portfolio return at t is < -1.5%)
+            shocks = np.zeros_like(independent_shocks)
+
+            # For t=0, use base
+            if t == 0:
+                shocks = lower_triangular_matmul(base_cholesky, independent_shocks)
+            else:
+                # Simple returns of the previous step across all simulations
+                # (Simple average return as proxy for portfolio)
+                prev_returns = np.expm1(all_shocks[:, :, t - 1])
+                avg_prev_returns = np.mean(prev_returns, axis=0)
+
+                stress_mask = avg_prev_returns < STRESS_RETURN_THRESHOLD
+
+                # Apply appropriate Cholesky
+                shocks[:, ~stress_mask] = lower_triangular_matmul(
+                    base_cholesky, independent_shocks[:, ~stress_mask], overwrite=True
+                )
+                shocks[:, stress_mask] = lower_triangular_matmul(
+                    stress_cholesky, independent_shocks[:, stress_mask], overwrite=True
+                )
+
+            # Geometric Brownian Motion log return for this step
+            all_shocks[:, :, t] = drift_col + sigma_sqrt_dt_col * shocks
+
     def _generate_correlated_shocks(
-        self, num_assets: int, num_simulations: int, num_days: int, cholesky: np.ndarray
+        self,
+        num_assets: int,
+        num_simulations: int,
+        num_days: int,
+        cholesky: np.ndarray,
+        rng: Optional[np.random.Generator] = None,
     ) -> np.ndarray:
         """Generate correlated random shocks.
 
@@ -148,20 +484,22 @@ class MonteCarloSimulation:
             num_simulations: Number of simulation paths
             num_days: Number of time steps
             cholesky: Cholesky decomposition of correlation matrix
+            rng: Random generator to draw from (a fresh unseeded one if None)
 
         Returns:
             Correlated random shocks
         """
+        if rng is None:
+            rng = np.random.default_rng()
+
         # Generate independent standard normal variables
-        independent_shocks = np.random.normal(0, 1, (num_assets, num_simulations, num_days))
+        independent_shocks = rng.standard_normal((num_assets, num_simulations, num_days), dtype=self.dtype)
 
-        # Apply Cholesky transformation for each time step
-        correlated_shocks = np.zeros_like(independent_shocks)
-        for t in range(num_days):
-            for s in range(num_simulations):
-                correlated_shocks[:, s, t] = cholesky @ independent_shocks[:, s, t]
+        # Apply Cholesky transformation to every (simulation, time step) column in a single in-place trmm
+        flat_shocks = independent_shocks.reshape(num_assets, num_simulations * num_days)
+        correlated_shocks = lower_triangular_matmul(cholesky, flat_shocks, overwrite=True)
 
-        return correlated_shocks
+        return correlated_shocks.reshape(num_assets, num_simulations, num_days)
 
     def calculate_statistics(self, results: Dict) -> pd.DataFrame:
         """Calculate summary statistics from simulation results.
@@ -173,39 +511,41 @@ class MonteCarloSimulation:
             DataFrame with statistics for each asset
         """
         final_prices = results["final_prices"]
-
-        stats_list = []
-        for i, ticker in enumerate(self.tickers):
-            final_prices_asset = final_prices[i, :]
-
-            stats = {
-                "ticker": ticker,
-                "initial_price": self.initial_prices[i],
-                "mean_final_price": np.mean(final_prices_asset),
-                "median_final_price": np.median(final_prices_asset),
-                "std_final_price": np.std(final_prices_asset),
-                "min_final_price": np.min(final_prices_asset),
-                "max_final_price": np.max(final_prices_asset),
-                "percentile_5": np.percentile(final_prices_asset, 5),
-                "percentile_95": np.percentile(final_prices_asset, 95),
-                "mean_return": (np.mean(final_prices_asset) - self.initial_prices[i]) / self.initial_prices[i],
-                "probability_loss": np.mean(final_prices_asset < self.initial_prices[i]),
+        initial_prices = self.initial_prices
+
+        # One reduction per statistic across all assets
+        mean_final = final_prices.mean(axis=1)
+        percentile_5, percentile_95 = np.percentile(final_prices, [5, 95], axis=1)
+
+        return pd.DataFrame(
+            {
+                "ticker": self.tickers,
+                "initial_price": initial_prices,
+                "mean_final_price": mean_final,
+                "median_final_price": np.median(final_prices, axis=1),
+                "std_final_price": final_prices.std(axis=1),
+                "min_final_price": final_prices.min(axis=1),
+                "max_final_price": final_prices.max(axis=1),
+                "percentile_5": percentile_5,
+                "percentile_95": percentile_95,
+                "mean_return": (mean_final - initial_prices) / initial_prices,
+                "probability_loss": (final_prices < initial_prices[:, np.newaxis]).mean(axis=1),
             }
-            stats_list.append(stats)
-
-        return pd.DataFrame(stats_list)
+        )
 
     def get_price_paths_df(self, results: Dict, num_paths_to_show: int = 10) -> Dict[str, pd.DataFrame]:
         """Convert simulation results to DataFrames for visualization.
 
         Args:
             results: Results dictionary from simulate()
-            num_paths_to_show: Number of paths to include per asset
+            num_paths_to_show: Number of paths to include per asset (capped by the paths in results;
+                without full paths only the simulated sample paths are available)
 
         Returns:
             Dictionary of ticker -> DataFrame with price paths
         """
-        prices = results["prices"]
+        prices = results["prices"] if "prices" in results else results["sample_paths"]
+        num_paths_to_show = min(num_paths_to_show, prices.shape[1])
         num_days = prices.shape[2]
 
         dfs = {}
@@ -238,40 +578,31 @@ class MonteCarloSimulation:
             initial_portfolio_value: Initial portfolio value
 
         Returns:
-            Dictionary with VaR metrics
+            Dictionary with portfolio VaR metrics plus per-asset 'asset_var' and 'asset_cvar' by ticker
         """
         final_prices = results["final_prices"]
 
-        # Calculate portfolio values (assuming equal weights)
-        num_assets = len(self.tickers)
-        weight_per_asset = initial_portfolio_value / num_assets
+        # Equal-weight portfolio return for each simulation is the mean of the per-asset gross returns
+        portfolio_returns = self._inv_initial_prices @ final_prices / len(self.tickers) - 1.0
 
-        # Portfolio value for each simulation
-        portfolio_values = (
-            np.sum(
-                (final_prices / self.initial_prices[:, np.newaxis]) * (weight_per_asset / num_assets),
-                axis=0,
-            )
-            * num_assets
-        )
-
-        # Calculate returns
-        portfolio_returns = (portfolio_values - initial_portfolio_value) / initial_portfolio_value
+        # VaR and CVaR (Conditional VaR / Expected Shortfall) from one partition of the tail
+        var, cvar = tail_var_cvar(portfolio_returns, confidence_level)
 
-        # VaR calculation
-        var_percentile = (1 - confidence_level) * 100
-        var = np.percentile(portfolio_returns, var_percentile)
-
-        # CVaR (Conditional VaR / Expected Shortfall)
-        cvar = np.mean(portfolio_returns[portfolio_returns <= var])
+        # Per-asset VaR/CVaR for all tickers in one percentile call over the (assets, sims) returns
+        asset_var, asset_cvar = asset_var_cvar(
+            final_prices * self._inv_initial_prices[:, np.newaxis] - 1.0, confidence_level
+        )
 
+        # Plain floats: float32 scalars are not JSON serializable
         return {
-            "var": var,
-            "cvar": cvar,
-            "var_dollar": var * initial_portfolio_value,
-            "cvar_dollar": cvar * initial_portfolio_value,
+            "var": float(var),
+            "cvar": float(cvar),
+            "var_dollar": float(var * initial_portfolio_value),
+            "cvar_dollar": float(cvar * initial_portfolio_value),
             "confidence_level": confidence_level,
-            "mean_return": np.mean(portfolio_returns),
-            "std_return": np.std(portfolio_returns),
-            "probability_loss": np.mean(portfolio_returns < 0),
+            "mean_return": float(np.mean(portfolio_returns)),
+            "std_return": float(np.std(portfolio_returns)),
+            "probability_loss": float(np.mean(portfolio_returns < 0)),
+            "asset_var": dict(zip(self.tickers, asset_var.tolist())),
+            "asset_cvar": dict(zip(self.tickers, asset_cvar.tolist())),
         }
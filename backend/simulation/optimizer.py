@@ -6,6 +6,8 @@ from typing import Dict, Tuple
 import numpy as np
 import scipy.optimize as sco
 
+from backend.simulation.utils import make_positive_definite
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,12 +31,21 @@ class PortfolioOptimizer:
         self.returns = np.array([expected_returns[t] for t in self.tickers])
         self.vols = np.array([volatilities[t] for t in self.tickers])
 
+        self.num_assets = len(self.tickers)
+
         # Calculate covariance matrix
         # Cov = Diag(vols) * Corr * Diag(vols)
         diag_vols = np.diag(self.vols)
         self.covariance = diag_vols @ correlation_matrix @ diag_vols
 
-        self.num_assets = len(self.tickers)
+        # Factor once so w' Cov w = ||L' w||^2; the jitter keeps semi-definite inputs factorable
+        try:
+            self._chol_cov = np.linalg.cholesky(self.covariance + 1e-12 * np.eye(self.num_assets))
+        except np.linalg.LinAlgError:
+            # User-adjusted or stressed correlations can be slightly indefinite; repair them first
+            logger.warning("Correlation matrix is not positive definite, adjusting eigenvalues")
+            self.covariance = diag_vols @ make_positive_definite(correlation_matrix) @ diag_vols
+            self._chol_cov = np.linalg.cholesky(self.covariance + 1e-12 * np.eye(self.num_assets))
 
     def portfolio_performance(self, weights: np.ndarray) -> Tuple[float, float, float, float]:
         """Calculate portfolio annual return, volatility, Sharpe ratio and Expected Shortfall.
@@ -46,7 +57,7 @@ class PortfolioOptimizer:
             Tuple of (return, volatility, Sharpe ratio, expected_shortfall)
         """
         port_return = np.sum(self.returns * weights)
-        port_vol = np.sqrt(weights.T @ self.covariance @ weights)
+        port_vol = np.linalg.norm(self._chol_cov.T @ weights)
         sharpe = port_return / port_vol if port_vol > 0 else 0
 
         # Parametric Expected Shortfall (95% confidence, normal distribution)
@@ -65,13 +76,30 @@ class PortfolioOptimizer:
         """Portfolio volatility to minimize it."""
         return self.portfolio_performance(weights)[1]
 
+    def _port_vol_jac(self, weights: np.ndarray) -> np.ndarray:
+        """Gradient of portfolio volatility: Cov w / sigma."""
+        y = self._chol_cov.T @ weights
+        port_vol = np.linalg.norm(y)
+        if port_vol == 0:
+            return np.zeros_like(weights)
+        return (self._chol_cov @ y) / port_vol
+
+    def _neg_sharpe_jac(self, weights: np.ndarray) -> np.ndarray:
+        """Gradient of the negative Sharpe ratio: -(mu / sigma - (mu'w) Cov w / sigma^3)."""
+        y = self._chol_cov.T @ weights
+        port_vol = np.linalg.norm(y)
+        if port_vol == 0:
+            return np.zeros_like(weights)
+        port_return = self.returns @ weights
+        return -(self.returns / port_vol - port_return * (self._chol_cov @ y) / port_vol**3)
+
     def optimize_maximum_sharpe(self) -> Dict:
         """Find weights that maximize the Sharpe ratio.
 
         Returns:
             Optimization results
         """
-        constraints = {"type": "eq", "fun": lambda x: np.sum(x) - 1}
+        constraints = {"type": "eq", "fun": lambda x: np.sum(x) - 1, "jac": lambda x: np.ones_like(x)}
         bounds = tuple((0, 1) for _ in range(self.num_assets))
         initial_guess = np.array(self.num_assets * [1.0 / self.num_assets])
 
@@ -79,6 +107,7 @@ class PortfolioOptimizer:
             self._neg_sharpe,
             initial_guess,
             method="SLSQP",
+            jac=self._neg_sharpe_jac,
             bounds=bounds,
             constraints=constraints,
         )
@@ -105,7 +134,7 @@ class PortfolioOptimizer:
         Returns:
             Optimization results
         """
-        constraints = {"type": "eq", "fun": lambda x: np.sum(x) - 1}
+        constraints = {"type": "eq", "fun": lambda x: np.sum(x) - 1, "jac": lambda x: np.ones_like(x)}
         bounds = tuple((0, 1) for _ in range(self.num_assets))
         initial_guess = np.array(self.num_assets * [1.0 / self.num_assets])
 
@@ -113,6 +142,7 @@ class PortfolioOptimizer:
             self._port_vol,
             initial_guess,
             method="SLSQP",
+            jac=self._port_vol_jac,
             bounds=bounds,
             constraints=constraints,
         )
@@ -1,6 +1,16 @@
 """Mathematical utilities for portfolio simulation."""
 
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator, Tuple
+
 import numpy as np
+from scipy.linalg.blas import get_blas_funcs
+
+# Thread-pool sizes read by OpenMP, the common BLAS builds and Numba when they load
+THREAD_LIMIT_ENV_VARS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "NUMBA_NUM_THREADS")
 
 
 def make_positive_definite(matrix: np.ndarray, epsilon: float = 1e-6) -> np.ndarray:
@@ -19,11 +29,137 @@ def make_positive_definite(matrix: np.ndarray, epsilon: float = 1e-6) -> np.ndar
     # Adjust negative eigenvalues
     eigenvalues[eigenvalues < epsilon] = epsilon
 
-    # Reconstruct matrix
-    adjusted_matrix = eigenvectors @ np.diag(eigenvalues) @ eigenvectors.T
+    # Reconstruct matrix as (V sqrt(L)) (V sqrt(L))' with a symmetric rank-k update;
+    # syrk only fills the upper triangle, so mirror it
+    scaled = eigenvectors * np.sqrt(eigenvalues)
+    syrk = get_blas_funcs("syrk", (scaled,))
+    upper = syrk(1.0, scaled)
+    adjusted_matrix = np.triu(upper) + np.triu(upper, 1).T
 
     # Normalize to correlation matrix (diagonal = 1)
     d = np.sqrt(np.diag(adjusted_matrix))
     adjusted_matrix = adjusted_matrix / np.outer(d, d)
 
     return adjusted_matrix
+
+
+def lower_triangular_matmul(lower: np.ndarray, x: np.ndarray, overwrite: bool = False) -> np.ndarray:
+    """Compute lower @ x for a lower-triangular matrix using BLAS trmm.
+
+    Only the lower triangle is touched, which halves the flops of a dense matmul.
+
+    Args:
+        lower: Lower-triangular matrix (n, n), e.g. a Cholesky factor
+        x: 2D array (n, m)
+        overwrite: If True and x is C-contiguous with the same dtype, the result is written into x
+
+    Returns:
+        Product with the same shape as x
+    """
+    trmm = get_blas_funcs("trmm", (lower, x))
+    # x.T of a C-ordered (n, m) array is a Fortran-ordered (m, n) array, and x.T @ lower.T == (lower @ x).T
+    return trmm(1.0, lower, x.T, side=1, lower=1, trans_a=1, overwrite_b=overwrite).T
+
+
+def workspace_view(out: np.ndarray, shape: Tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+    """Carve a C-contiguous array of the given shape and dtype out of a preallocated buffer.
+
+    The buffer is reinterpreted byte-wise from its start, so one workspace can back tensors of
+    different shapes and dtypes across calls.
+
+    Args:
+        out: C-contiguous buffer of any dtype
+        shape: Shape of the requested array
+        dtype: Dtype of the requested array
+
+    Returns:
+        View into the leading bytes of out
+    """
+    dtype = np.dtype(dtype)
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+    if not out.flags.c_contiguous or not out.flags.writeable:
+        raise ValueError("out must be a writeable C-contiguous array")
+    if out.nbytes < nbytes:
+        raise ValueError(f"out holds {out.nbytes} bytes but {nbytes} are needed for {shape} {dtype}")
+    return out.reshape(-1).view(np.uint8)[:nbytes].view(dtype).reshape(shape)
+
+
+def tail_var_cvar(returns: np.ndarray, confidence_level: float) -> Tuple[float, float]:
+    """Compute VaR and CVaR of a 1D sample with one O(n) partition instead of a full sort.
+
+    VaR is the order statistic at index floor((1 - confidence_level) * n); CVaR is the mean
+    of the returns at or below it.
+
+    Args:
+        returns: 1D array of simulated returns
+        confidence_level: Confidence level (e.g., 0.95 for 95%)
+
+    Returns:
+        Tuple of (var, cvar)
+    """
+    k = min(int((1 - confidence_level) * returns.size), returns.size - 1)
+    partitioned = np.partition(returns, k)
+    return float(partitioned[k]), float(partitioned[: k + 1].mean())
+
+
+def asset_var_cvar(asset_returns: np.ndarray, confidence_level: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute per-asset VaR and CVaR for every row of a (num_assets, num_simulations) sample at once.
+
+    VaR is the lower empirical percentile of each row (no interpolation); CVaR is the mean of the
+    returns at or below it.
+
+    Args:
+        asset_returns: 2D array of simulated returns, one row per asset
+        confidence_level: Confidence level (e.g., 0.95 for 95%)
+
+    Returns:
+        Tuple of (var, cvar) arrays of length num_assets
+    """
+    var = np.percentile(asset_returns, (1 - confidence_level) * 100, axis=1, method="lower", keepdims=True)
+    tail = asset_returns <= var
+    cvar = np.where(tail, asset_returns, 0).sum(axis=1) / tail.sum(axis=1)
+    return var[:, 0], cvar
+
+
+def _limit_worker_threads() -> None:
+    """Process-pool initializer: keep each worker to a single compute thread."""
+    for var in THREAD_LIMIT_ENV_VARS:
+        os.environ[var] = "1"
+    try:
+        import numba
+
+        numba.set_num_threads(1)
+    except ImportError:  # pragma: no cover - depends on the environment
+        pass
+
+
+@contextmanager
+def worker_process_pool(max_workers: int) -> Iterator[ProcessPoolExecutor]:
+    """Process pool for CPU-bound batches that does not oversubscribe or inherit thread pools.
+
+    Workers are spawned rather than forked, because forking after Numba or BLAS have started
+    their thread pools can deadlock the children. The thread-limit variables are set while the
+    pool is open so spawned workers load their libraries single-threaded, and the initializer
+    caps anything already loaded.
+
+    Args:
+        max_workers: Number of worker processes
+
+    Yields:
+        ProcessPoolExecutor
+    """
+    saved = {var: os.environ.get(var) for var in THREAD_LIMIT_ENV_VARS}
+    os.environ.update({var: "1" for var in THREAD_LIMIT_ENV_VARS})
+    try:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_limit_worker_threads,
+        ) as executor:
+            yield executor
+    finally:
+        for var, value in saved.items():
+            if value is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = value
@@ -1,15 +1,23 @@
 """Shared test fixtures for the backend test suite."""
 
+import functools
+from types import MappingProxyType
+from typing import Mapping, Tuple
+
 import numpy as np
 import pandas as pd
 import pytest
 
+from backend.simulation.monte_carlo import MonteCarloSimulation
+
+# Ticker -> (initial price, expected annual return, annual volatility) for Monte Carlo tests
+MC_ASSETS = {"AAPL": (150.0, 0.10, 0.25), "MSFT": (250.0, 0.12, 0.30)}
+
 
 @pytest.fixture
 def sample_prices():
     """Generate a simple price series for testing."""
-    np.random.seed(42)
-    returns = np.random.normal(0.0005, 0.01, 252)
+    returns = np.random.default_rng(42).normal(0.0005, 0.01, 252)
     prices = 100 * np.cumprod(1 + returns)
     return prices
 
@@ -17,21 +25,20 @@ def sample_prices():
 @pytest.fixture
 def sample_returns():
     """Generate a simple return series for testing."""
-    np.random.seed(42)
-    return np.random.normal(0.0005, 0.01, 252)
+    return np.random.default_rng(42).normal(0.0005, 0.01, 252)
 
 
 @pytest.fixture
 def sample_returns_df():
     """Generate a multi-asset returns DataFrame."""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     n = 252
     dates = pd.date_range("2023-01-01", periods=n, freq="B")
     return pd.DataFrame(
         {
-            "SPY": np.random.normal(0.0005, 0.012, n),
-            "TLT": np.random.normal(0.0002, 0.008, n),
-            "GLD": np.random.normal(0.0003, 0.010, n),
+            "SPY": rng.normal(0.0005, 0.012, n),
+            "TLT": rng.normal(0.0002, 0.008, n),
+            "GLD": rng.normal(0.0003, 0.010, n),
         },
         index=dates,
     )
@@ -59,3 +66,42 @@ def sample_weights():
 def sample_tickers():
     """Standard ticker list."""
     return ["SPY", "TLT", "GLD"]
+
+
+def _make_mc_sim(tickers: Tuple[str, ...]) -> MonteCarloSimulation:
+    """Build an uncorrelated Monte Carlo simulation over MC_ASSETS tickers."""
+    return MonteCarloSimulation(
+        initial_prices={t: MC_ASSETS[t][0] for t in tickers},
+        expected_returns={t: MC_ASSETS[t][1] for t in tickers},
+        volatilities={t: MC_ASSETS[t][2] for t in tickers},
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _run_sim(tickers_key: Tuple[str, ...], n_sims: int, n_days: int, seed: int) -> Mapping:
+    """Run (once per argument set) a seeded simulation with full paths and freeze its results."""
+    results = _make_mc_sim(tickers_key).simulate(
+        num_simulations=n_sims, num_days=n_days, random_seed=seed, store_full_paths=True
+    )
+    for value in results.values():
+        if isinstance(value, np.ndarray):
+            value.flags.writeable = False
+    return MappingProxyType(results)
+
+
+@pytest.fixture(scope="session")
+def mc_sim_single():
+    """Single-asset Monte Carlo simulation (AAPL)."""
+    return _make_mc_sim(("AAPL",))
+
+
+@pytest.fixture(scope="session")
+def mc_sim_two_asset():
+    """Uncorrelated two-asset Monte Carlo simulation (AAPL, MSFT)."""
+    return _make_mc_sim(("AAPL", "MSFT"))
+
+
+@pytest.fixture(scope="session")
+def run_sim():
+    """Memoized simulation runner: run_sim(tickers, n_sims, n_days, seed) -> read-only results."""
+    return _run_sim
@@ -1,3 +1,4 @@
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -5,6 +6,22 @@ import pytest
 from backend.scenarios.ai_engine import AIScenarioEngine
 
 
+@pytest.fixture
+def mock_openai(monkeypatch):
+    """Replace the OpenAI client class; returns the client the engine will receive."""
+    client = MagicMock()
+    monkeypatch.setattr("backend.scenarios.ai_engine.OpenAI", lambda api_key: client)
+    return client
+
+
+@pytest.fixture
+def mock_anthropic(monkeypatch):
+    """Replace the Anthropic client class; returns the client the engine will receive."""
+    client = MagicMock()
+    monkeypatch.setattr("backend.scenarios.ai_engine.Anthropic", lambda api_key: client)
+    return client
+
+
 def test_ai_engine_init():
     """Test initialization with different providers."""
     # Test OpenAI init
@@ -20,7 +37,7 @@ def test_ai_engine_init():
         mock_anthropic.assert_called_once_with(api_key="test_key")
 
 
-def test_generate_scenario_params_openai():
+def test_generate_scenario_params_openai(mock_openai):
     """Test scenario generation using OpenAI mock."""
     mock_response = MagicMock()
     mock_response.choices[0].message.content = """
@@ -37,23 +54,20 @@ def test_generate_scenario_params_openai():
     }
     """
 
-    with patch("backend.scenarios.ai_engine.OpenAI") as mock_openai:
-        mock_client = mock_openai.return_value
-        mock_client.chat.completions.create.return_value = mock_response
+    mock_openai.chat.completions.create.return_value = mock_response
 
-        engine = AIScenarioEngine(api_key="test_key", provider="openai")
-        result = engine.generate_scenario_params("tech crash", ["AAPL", "MSFT"])
+    engine = AIScenarioEngine(api_key="test_key", provider="openai")
+    result = engine.generate_scenario_params("tech crash", ["AAPL", "MSFT"])
 
-        assert result["name"] == "Tech Crash"
-        assert result["parameters"]["return_shocks"]["AAPL"] == -0.2
-        assert result["category"] == "market_crash"
-        mock_client.chat.completions.create.assert_called_once()
+    assert result["name"] == "Tech Crash"
+    assert result["parameters"]["return_shocks"]["AAPL"] == -0.2
+    assert result["category"] == "market_crash"
+    mock_openai.chat.completions.create.assert_called_once()
 
 
-def test_generate_scenario_params_anthropic():
+def test_generate_scenario_params_anthropic(mock_anthropic):
     """Test scenario generation using Anthropic mock."""
-    mock_response = MagicMock()
-    mock_response.content = [MagicMock(text="""
+    mock_response = SimpleNamespace(content=[SimpleNamespace(text="""
     {
         "name": "Rate Hike",
         "description": "Fed raises rates",
@@ -65,18 +79,16 @@ def test_generate_scenario_params_anthropic():
         },
         "tags": ["rates"]
     }
-    """)]
+    """)])
 
-    with patch("backend.scenarios.ai_engine.Anthropic") as mock_anthropic:
-        mock_client = mock_anthropic.return_value
-        mock_client.messages.create.return_value = mock_response
+    mock_anthropic.messages.create.return_value = mock_response
 
-        engine = AIScenarioEngine(api_key="test_key", provider="anthropic")
-        result = engine.generate_scenario_params("rate hike", ["TLT"])
+    engine = AIScenarioEngine(api_key="test_key", provider="anthropic")
+    result = engine.generate_scenario_params("rate hike", ["TLT"])
 
-        assert result["name"] == "Rate Hike"
-        assert result["parameters"]["return_shocks"]["TLT"] == -0.1
-        mock_client.messages.create.assert_called_once()
+    assert result["name"] == "Rate Hike"
+    assert result["parameters"]["return_shocks"]["TLT"] == -0.1
+    mock_anthropic.messages.create.assert_called_once()
 
 
 def test_ai_engine_missing_key():
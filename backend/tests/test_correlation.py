@@ -2,34 +2,34 @@
 
 import numpy as np
 import pandas as pd
+import pytest
 
 from backend.simulation.correlation_matrix import CorrelationMatrix
 
 
+@pytest.fixture(scope="module")
+def prebuilt_corr_calc():
+    """Correlation calculator fitted once on 100 days of random returns for three assets."""
+    rng = np.random.default_rng(42)
+    returns_df = pd.DataFrame(rng.normal(0, 0.01, size=(100, 3)), columns=["AAPL", "MSFT", "GOOGL"])
+    corr_calc = CorrelationMatrix()
+    corr_calc.calculate_from_returns(returns_df)
+    return corr_calc
+
+
 class TestCorrelationMatrix:
     """Test cases for correlation matrix calculator."""
 
-    def test_calculate_from_returns(self):
+    def test_calculate_from_returns(self, prebuilt_corr_calc):
         """Test correlation calculation from returns DataFrame."""
-        # Create sample returns data
-        np.random.seed(42)
-        returns_df = pd.DataFrame(
-            {
-                "AAPL": np.random.normal(0, 0.01, 100),
-                "MSFT": np.random.normal(0, 0.01, 100),
-                "GOOGL": np.random.normal(0, 0.01, 100),
-            }
-        )
-
-        corr_calc = CorrelationMatrix()
-        corr_matrix = corr_calc.calculate_from_returns(returns_df)
+        corr_matrix = prebuilt_corr_calc.correlation_matrix
 
         assert corr_matrix.shape == (3, 3)
         assert list(corr_matrix.columns) == ["AAPL", "MSFT", "GOOGL"]
         # Diagonal should be 1
-        assert np.allclose(np.diag(corr_matrix.values), 1.0)
+        np.testing.assert_allclose(np.diag(corr_matrix.values), 1.0)
         # Matrix should be symmetric
-        assert np.allclose(corr_matrix.values, corr_matrix.values.T)
+        np.testing.assert_allclose(corr_matrix.values, corr_matrix.values.T)
 
     def test_get_cholesky_decomposition(self):
         """Test Cholesky decomposition."""
@@ -40,9 +40,29 @@ class TestCorrelationMatrix:
         corr_calc.calculate_from_returns(returns_df)
         cholesky = corr_calc.get_cholesky_decomposition()
 
-        # Verify L @ L.T = correlation matrix
-        reconstructed = cholesky @ cholesky.T
-        assert np.allclose(reconstructed, corr_calc.correlation_matrix.values, atol=1e-10)
+        # 2x2 factor has the closed form [[1, 0], [rho, sqrt(1 - rho^2)]]
+        rho = corr_calc.correlation_matrix.values[0, 1]
+        assert cholesky[0, 0] == pytest.approx(1.0)
+        assert cholesky[0, 1] == 0.0
+        assert cholesky[1, 0] == pytest.approx(rho)
+        assert cholesky[1, 1] == pytest.approx(np.sqrt(1 - rho**2))
+
+    def test_cholesky_is_cached_until_matrix_changes(self, prebuilt_corr_calc):
+        """Test the Cholesky factor is reused and recomputed after the matrix changes."""
+        corr_calc = CorrelationMatrix()
+        corr_calc.correlation_matrix = prebuilt_corr_calc.correlation_matrix.copy()
+
+        first = corr_calc.get_cholesky_decomposition()
+        assert corr_calc.get_cholesky_decomposition() is first
+        assert not first.flags.writeable
+
+        corr_calc.correlation_matrix.iloc[0, 1] = corr_calc.correlation_matrix.iloc[1, 0] = 0.5
+        updated = corr_calc.get_cholesky_decomposition()
+        assert updated is not first
+        assert updated[1, 0] == pytest.approx(0.5)
+
+        corr_calc.invalidate()
+        assert corr_calc.get_cholesky_decomposition() is not updated
 
     def test_make_positive_definite(self):
         """Test making a matrix positive definite."""
@@ -57,50 +77,42 @@ class TestCorrelationMatrix:
         assert np.all(eigenvalues > 0)
 
         # Diagonal should still be 1
-        assert np.allclose(np.diag(adjusted), 1.0)
+        np.testing.assert_allclose(np.diag(adjusted), 1.0)
 
-    def test_get_correlation(self):
-        """Test getting correlation between two assets."""
-        returns_df = pd.DataFrame({"AAPL": [0.01, 0.02, -0.01], "MSFT": [0.02, 0.01, -0.02]})
+        # Result is exactly symmetric and leaves an already valid correlation matrix unchanged
+        np.testing.assert_array_equal(adjusted, adjusted.T)
+        valid = np.array([[1.0, 0.3, -0.2], [0.3, 1.0, 0.1], [-0.2, 0.1, 1.0]])
+        np.testing.assert_allclose(corr_calc._make_positive_definite(valid), valid, atol=1e-12)
 
-        corr_calc = CorrelationMatrix()
-        corr_calc.calculate_from_returns(returns_df)
+    def test_make_positive_definite_uses_eigh(self, monkeypatch):
+        """Test the correction uses the symmetric eigensolver (LAPACK syevd) rather than general eig (geev)."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("np.linalg.eig should not be used on a symmetric matrix")
 
-        corr = corr_calc.get_correlation("AAPL", "MSFT")
+        monkeypatch.setattr(np.linalg, "eig", fail)
+        monkeypatch.setattr(np.linalg, "eigvals", fail)
+
+        matrix = np.array([[1.0, 0.9, 0.9], [0.9, 1.0, 0.9], [0.9, 0.9, 1.0]])
+        adjusted = CorrelationMatrix()._make_positive_definite(matrix)
+
+        assert np.all(np.linalg.eigvalsh(adjusted) > 0)
+
+    def test_get_correlation(self, prebuilt_corr_calc):
+        """Test getting correlation between two assets."""
+        corr = prebuilt_corr_calc.get_correlation("AAPL", "MSFT")
         assert isinstance(corr, (float, np.floating))
         assert -1 <= corr <= 1
 
-    def test_get_average_correlation(self):
+    def test_get_average_correlation(self, prebuilt_corr_calc):
         """Test average correlation calculation."""
-        returns_df = pd.DataFrame(
-            {
-                "A": [0.01, 0.02, -0.01],
-                "B": [0.02, 0.01, -0.02],
-                "C": [0.01, -0.01, 0.02],
-            }
-        )
-
-        corr_calc = CorrelationMatrix()
-        corr_calc.calculate_from_returns(returns_df)
-
-        avg_corr = corr_calc.get_average_correlation()
+        avg_corr = prebuilt_corr_calc.get_average_correlation()
         assert isinstance(avg_corr, (float, np.floating))
         assert -1 <= avg_corr <= 1
 
-    def test_get_correlation_summary(self):
+    def test_get_correlation_summary(self, prebuilt_corr_calc):
         """Test correlation summary statistics."""
-        returns_df = pd.DataFrame(
-            {
-                "A": [0.01, 0.02, -0.01],
-                "B": [0.02, 0.01, -0.02],
-                "C": [0.01, -0.01, 0.02],
-            }
-        )
-
-        corr_calc = CorrelationMatrix()
-        corr_calc.calculate_from_returns(returns_df)
-
-        summary = corr_calc.get_correlation_summary()
+        summary = prebuilt_corr_calc.get_correlation_summary()
 
         assert "mean" in summary
         assert "median" in summary
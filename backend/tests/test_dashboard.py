@@ -7,14 +7,14 @@ from backend.simulation.dashboard import DashboardAggregator
 
 
 def _make_dashboard():
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     n = 252
     dates = pd.date_range("2023-01-01", periods=n, freq="B")
     returns = pd.DataFrame(
         {
-            "SPY": np.random.normal(0.0004, 0.012, n),
-            "TLT": np.random.normal(0.0001, 0.007, n),
-            "GLD": np.random.normal(0.0003, 0.010, n),
+            "SPY": rng.normal(0.0004, 0.012, n),
+            "TLT": rng.normal(0.0001, 0.007, n),
+            "GLD": rng.normal(0.0003, 0.010, n),
         },
         index=dates,
     )
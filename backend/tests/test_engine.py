@@ -0,0 +1,80 @@
+"""Tests for the simulation engine data preparation."""
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.database import AssetPrice, Base
+from backend.simulation.engine import SimulationEngine
+
+
+@pytest.fixture
+def db_session(sample_returns_df):
+    """In-memory SQLite session populated with prices built from sample returns."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    prices = 100 * (1 + sample_returns_df).cumprod()
+    for ticker in prices.columns:
+        for date, close in prices[ticker].items():
+            session.add(AssetPrice(ticker=ticker, asset_class="equity", date=date.to_pydatetime(), close=close))
+    session.commit()
+
+    yield session
+    session.close()
+
+
+class TestPrepareSimulationStats:
+    def test_matches_dataframe_path(self, db_session):
+        engine = SimulationEngine(db_session)
+        tickers = ["SPY", "TLT", "GLD"]
+
+        expected = engine.prepare_simulation_data(tickers, "2023-01-01", "2024-12-31")
+        stats = engine.prepare_simulation_stats(tickers, "2023-01-01", "2024-12-31")
+
+        order = list(expected["returns_df"].columns)
+        assert list(stats["expected_returns"]) == order
+        for key in ("initial_prices", "expected_returns", "volatilities"):
+            np.testing.assert_allclose(
+                [stats[key][t] for t in order], [expected[key][t] for t in order], rtol=1e-9, atol=1e-12
+            )
+        np.testing.assert_allclose(stats["correlation_matrix"], expected["correlation_matrix"], atol=1e-9)
+
+    def test_matches_dataframe_path_with_gapped_calendar(self, db_session):
+        # SPY misses two days on which the other tickers trade (e.g. an equity holiday) and GLD starts late
+        dates = sorted({row.date for row in db_session.query(AssetPrice.date).filter(AssetPrice.ticker == "SPY")})
+        for ticker, date in (("SPY", dates[10]), ("SPY", dates[30]), ("GLD", dates[0]), ("GLD", dates[1])):
+            db_session.query(AssetPrice).filter(AssetPrice.ticker == ticker, AssetPrice.date == date).delete()
+        db_session.commit()
+
+        engine = SimulationEngine(db_session)
+        tickers = ["SPY", "TLT", "GLD"]
+
+        expected = engine.prepare_simulation_data(tickers, "2023-01-01", "2024-12-31")
+        stats = engine.prepare_simulation_stats(tickers, "2023-01-01", "2024-12-31")
+
+        # Holidays are forward filled (zero return) rather than dropped; only the days before GLD starts go
+        assert len(expected["returns_df"]) == len(dates) - 3
+        assert expected["returns_df"].loc[dates[10], "SPY"] == 0.0
+
+        order = list(expected["returns_df"].columns)
+        for key in ("expected_returns", "volatilities"):
+            np.testing.assert_allclose(
+                [stats[key][t] for t in order], [expected[key][t] for t in order], rtol=1e-9, atol=1e-12
+            )
+        np.testing.assert_allclose(stats["correlation_matrix"], expected["correlation_matrix"], atol=1e-9)
+
+    def test_missing_ticker_is_skipped(self, db_session):
+        stats = SimulationEngine(db_session).prepare_simulation_stats(["SPY", "XXX"], "2023-01-01", "2024-12-31")
+        assert list(stats["initial_prices"]) == ["SPY"]
+        assert stats["correlation_matrix"].shape == (1, 1)
+
+    def test_no_data_raises(self, db_session):
+        with pytest.raises(ValueError):
+            SimulationEngine(db_session).prepare_simulation_stats(["XXX"], "2023-01-01", "2024-12-31")
+
+    def test_invalid_dates(self, db_session):
+        with pytest.raises(ValueError):
+            SimulationEngine(db_session).prepare_simulation_stats(["SPY"], "2024-01-01", "2023-01-01")
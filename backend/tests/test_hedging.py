@@ -3,38 +3,49 @@ import pytest
 from backend.simulation.hedging_service import HedgingService
 
 
-def test_hedging_calculation():
-    tickers = ["AAPL", "GOOGL"]
-    hedger = HedgingService(tickers, initial_total_value=100000.0)
+@pytest.fixture(scope="module")
+def hedger_100k():
+    """Two-asset hedger on a $100k portfolio, shared by the module."""
+    return HedgingService(["AAPL", "GOOGL"], initial_total_value=100000.0)
 
-    current_weights = {"AAPL": 0.5, "GOOGL": 0.5}
-    target_weights = {"AAPL": 0.3, "GOOGL": 0.7}
 
-    trades = hedger.calculate_trades(current_weights, target_weights)
-
-    assert len(trades) == 2
+@pytest.fixture(scope="module")
+def hedger_default():
+    """Two-asset hedger with the default portfolio value, shared by the module."""
+    return HedgingService(["AAPL", "GOOGL"])
 
-    # Check SELL
-    sell_trade = next(t for t in trades if t["action"] == "SELL")
-    assert sell_trade["ticker"] == "AAPL"
-    assert sell_trade["weight_change"] == pytest.approx(0.2)
-    assert sell_trade["dollar_value"] == pytest.approx(20000.0)
 
-    # Check BUY
-    buy_trade = next(t for t in trades if t["action"] == "BUY")
-    assert buy_trade["ticker"] == "GOOGL"
-    assert buy_trade["weight_change"] == pytest.approx(0.2)
-    assert buy_trade["dollar_value"] == pytest.approx(20000.0)
+@pytest.mark.parametrize(
+    "current_weights,target_weights,expected_trades",
+    [
+        (
+            {"AAPL": 0.5, "GOOGL": 0.5},
+            {"AAPL": 0.3, "GOOGL": 0.7},
+            [("AAPL", "SELL", 0.2, 20000.0), ("GOOGL", "BUY", 0.2, 20000.0)],
+        ),
+        (
+            {"AAPL": 0.2, "GOOGL": 0.8},
+            {"AAPL": 0.6, "GOOGL": 0.4},
+            [("GOOGL", "SELL", 0.4, 40000.0), ("AAPL", "BUY", 0.4, 40000.0)],
+        ),
+    ],
+)
+def test_hedging_calculation(hedger_100k, current_weights, target_weights, expected_trades):
+    trades = hedger_100k.calculate_trades(current_weights, target_weights)
 
+    assert len(trades) == len(expected_trades)
+    for trade, (ticker, action, weight_change, dollar_value) in zip(trades, expected_trades):
+        assert trade["ticker"] == ticker
+        assert trade["action"] == action
+        assert trade["weight_change"] == pytest.approx(weight_change)
+        assert trade["dollar_value"] == pytest.approx(dollar_value)
 
-def test_generate_recommendations():
-    tickers = ["AAPL", "GOOGL"]
-    hedger = HedgingService(tickers)
 
+def test_generate_recommendations(hedger_default):
     opt_result = {"success": True, "weights": {"AAPL": 0.6, "GOOGL": 0.4}}
 
     # Starting from equal weights (0.5, 0.5)
-    result = hedger.generate_recommendations(opt_result)
+    result = hedger_default.generate_recommendations(opt_result)
 
     assert "trades" in result
     assert result["total_value"] == 1000000.0
@@ -43,3 +54,28 @@ def test_generate_recommendations():
     aapl_trade = next(t for t in result["trades"] if t["ticker"] == "AAPL")
     assert aapl_trade["action"] == "BUY"
     assert aapl_trade["target_weight"] == 0.6
+
+
+def test_trades_ordering_and_threshold():
+    hedger = HedgingService(["A", "B", "C", "D"], initial_total_value=100000.0)
+
+    current_weights = {"A": 0.25, "B": 0.25, "C": 0.25, "D": 0.25}
+    target_weights = {"A": 0.40, "B": 0.10, "C": 0.2505, "D": 0.2495}
+
+    trades = hedger.calculate_trades(current_weights, target_weights)
+
+    # C and D are below the 0.1% threshold; SELLs come before BUYs
+    assert [t["ticker"] for t in trades] == ["B", "A"]
+    assert [t["action"] for t in trades] == ["SELL", "BUY"]
+
+
+def test_repeated_calls_are_independent():
+    hedger = HedgingService(["A", "B"], initial_total_value=100000.0)
+
+    first = hedger.calculate_trades({"A": 0.5, "B": 0.5}, {"A": 0.2, "B": 0.8})
+    second = hedger.calculate_trades({"A": 0.5, "B": 0.5}, {"A": 0.5, "B": 0.5})
+
+    assert second == []
+    # Earlier results must not alias the reused scratch buffers
+    assert first[0]["weight_change"] == pytest.approx(0.3)
+    assert first[1]["target_weight"] == pytest.approx(0.8)
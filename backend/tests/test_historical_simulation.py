@@ -0,0 +1,98 @@
+"""Tests for historical bootstrap simulation."""
+
+import numpy as np
+import pytest
+
+from backend.simulation import historical_simulation
+from backend.simulation.historical_simulation import HistoricalSimulation
+
+
+def _make_sim(sample_returns_df):
+    return HistoricalSimulation(sample_returns_df, {"SPY": 450.0, "TLT": 95.0, "GLD": 180.0})
+
+
+class TestSimulate:
+    def test_shapes(self, sample_returns_df):
+        results = _make_sim(sample_returns_df).simulate(
+            num_simulations=50, num_days=20, random_seed=42, return_paths=True
+        )
+        assert results["prices"].shape == (3, 50, 21)
+        assert results["returns"].shape == (3, 50, 20)
+        assert results["final_prices"].shape == (3, 50)
+
+    def test_final_prices_without_paths(self, sample_returns_df):
+        sim = _make_sim(sample_returns_df)
+        lean = sim.simulate(num_simulations=30, num_days=15, random_seed=3)
+        full = sim.simulate(num_simulations=30, num_days=15, random_seed=3, return_paths=True)
+        assert "prices" not in lean
+        np.testing.assert_allclose(lean["final_prices"], full["final_prices"])
+
+    def test_chunked_matches_unchunked(self, sample_returns_df, monkeypatch):
+        sim = _make_sim(sample_returns_df)
+        full = sim.simulate(num_simulations=25, num_days=12, block_size=4, random_seed=11, return_paths=True)
+        monkeypatch.setattr(historical_simulation, "SIMULATION_CHUNK_SIZE", 7)
+        chunked = sim.simulate(num_simulations=25, num_days=12, block_size=4, random_seed=11)
+        np.testing.assert_allclose(chunked["final_prices"], full["final_prices"])
+
+    def test_reproducible_with_seed(self, sample_returns_df):
+        sim = _make_sim(sample_returns_df)
+        first = sim.simulate(num_simulations=20, num_days=10, block_size=3, random_seed=7)
+        second = sim.simulate(num_simulations=20, num_days=10, block_size=3, random_seed=7)
+        np.testing.assert_array_equal(first["final_prices"], second["final_prices"])
+
+    def test_block_bootstrap_samples_consecutive_days(self, sample_returns_df):
+        indices = HistoricalSimulation._block_indices(40, 13, 5, len(sample_returns_df), np.random.default_rng(2))
+        assert indices.shape == (40, 13)
+        # Within each 5-day block the historical row index advances by exactly one
+        blocks = indices[:, :10].reshape(40, 2, 5)
+        assert (np.diff(blocks, axis=2) == 1).all()
+        assert indices.min() >= 0 and indices.max() < len(sample_returns_df)
+
+        sim = _make_sim(sample_returns_df)
+        returns = sim._sample_returns(40, 13, 5, np.random.default_rng(2))
+        np.testing.assert_array_equal(returns, sample_returns_df.to_numpy().T[:, indices])
+
+    def test_sample_into_workspace(self, sample_returns_df):
+        sim = _make_sim(sample_returns_df)
+        workspace = np.empty(3 * 30 * 15, dtype=np.float64)
+        for block_size in (1, 4):
+            expected = sim.simulate(
+                num_simulations=30, num_days=15, block_size=block_size, random_seed=9, return_paths=True
+            )
+            full = sim.simulate(
+                num_simulations=30, num_days=15, block_size=block_size, random_seed=9, return_paths=True, out=workspace
+            )
+            assert np.shares_memory(full["returns"], workspace)
+            np.testing.assert_array_equal(full["returns"], expected["returns"])
+
+            lean = sim.simulate(num_simulations=30, num_days=15, block_size=block_size, random_seed=9, out=workspace)
+            np.testing.assert_allclose(lean["final_prices"], expected["final_prices"])
+
+    def test_does_not_touch_global_rng(self, sample_returns_df):
+        np.random.seed(0)
+        expected = np.random.random()
+        np.random.seed(0)
+        _make_sim(sample_returns_df).simulate(num_simulations=10, num_days=5, random_seed=1)
+        assert np.random.random() == expected
+
+
+class TestCalculateVar:
+    def test_equal_weight_portfolio_return(self, sample_returns_df):
+        sim = _make_sim(sample_returns_df)
+        results = {"final_prices": sim.initial_prices[:, np.newaxis] * np.array([[1.1, 0.9], [1.0, 0.8], [1.3, 0.7]])}
+        var_metrics = sim.calculate_var(results, confidence_level=0.5)
+        # Per-simulation equal-weight returns are +13.33% and -20%
+        assert var_metrics["mean_return"] == pytest.approx((0.4 / 3 - 0.2) / 2)
+        assert var_metrics["probability_loss"] == pytest.approx(0.5)
+
+
+class TestEmpiricalDistribution:
+    def test_moments(self, sample_returns_df):
+        sim = _make_sim(sample_returns_df)
+        results = sim.simulate(num_simulations=200, num_days=10, random_seed=5)
+        dist = sim.get_empirical_distribution(results, "SPY")
+
+        data = results["final_prices"][0]
+        z = (data - data.mean()) / data.std()
+        assert dist["skewness"] == pytest.approx(np.mean(z**3))
+        assert dist["kurtosis"] == pytest.approx(np.mean(z**4) - 3)
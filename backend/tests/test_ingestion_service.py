@@ -0,0 +1,56 @@
+"""Tests for the data ingestion service database writes."""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.data_ingestion import ingestion_service
+from backend.data_ingestion.ingestion_service import IngestionService
+from backend.database import AssetPrice, Base
+
+
+@pytest.fixture
+def db_session():
+    """Empty in-memory SQLite session."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def price_frame():
+    """Two tickers of daily OHLC prices without volume/adjusted close columns."""
+    dates = pd.date_range("2024-01-01", periods=5, freq="B")
+    close = np.arange(100.0, 105.0)
+    return pd.concat(
+        [
+            pd.DataFrame(
+                {"ticker": ticker, "date": dates, "open": close, "high": close + 1, "low": close - 1, "close": close}
+            )
+            for ticker in ("SPY", "TLT")
+        ],
+        ignore_index=True,
+    )
+
+
+def test_ingest_asset_prices_batched(db_session, price_frame, monkeypatch):
+    service = IngestionService()
+    monkeypatch.setattr(service.yf_connector, "fetch_multiple_tickers", lambda *args: price_frame)
+    monkeypatch.setattr(ingestion_service, "INSERT_BATCH_SIZE", 3)
+
+    inserted = service.ingest_asset_prices(
+        db_session, ["SPY", "TLT"], "equity", datetime(2024, 1, 1), datetime(2024, 1, 8)
+    )
+
+    assert inserted == 10
+    rows = db_session.query(AssetPrice).order_by(AssetPrice.ticker, AssetPrice.date).all()
+    assert len(rows) == 10
+    assert rows[0].ticker == "SPY" and rows[0].asset_class == "equity"
+    assert rows[-1].close == pytest.approx(104.0)
+    assert rows[0].volume is None and rows[0].adjusted_close is None
@@ -1,42 +1,30 @@
 """Tests for Monte Carlo simulation."""
 
 import numpy as np
+import pytest
 
+from backend.simulation import monte_carlo
 from backend.simulation.monte_carlo import MonteCarloSimulation
 
 
+@pytest.fixture(scope="module")
+def chol_2x2():
+    """Cholesky factor of the 2x2 correlation matrix with rho = 0.7, factored once per module."""
+    return np.linalg.cholesky(np.array([[1.0, 0.7], [0.7, 1.0]]))
+
+
 class TestMonteCarloSimulation:
     """Test cases for Monte Carlo simulation."""
 
-    def test_initialization(self):
+    def test_initialization(self, mc_sim_two_asset):
         """Test Monte Carlo simulation initialization."""
-        initial_prices = {"AAPL": 150.0, "MSFT": 250.0}
-        expected_returns = {"AAPL": 0.10, "MSFT": 0.12}
-        volatilities = {"AAPL": 0.25, "MSFT": 0.30}
-
-        mc_sim = MonteCarloSimulation(
-            initial_prices=initial_prices,
-            expected_returns=expected_returns,
-            volatilities=volatilities,
-        )
+        assert len(mc_sim_two_asset.tickers) == 2
+        assert mc_sim_two_asset.tickers == ["AAPL", "MSFT"]
+        np.testing.assert_allclose(mc_sim_two_asset.initial_prices, [150.0, 250.0])
 
-        assert len(mc_sim.tickers) == 2
-        assert mc_sim.tickers == ["AAPL", "MSFT"]
-        assert np.allclose(mc_sim.initial_prices, [150.0, 250.0])
-
-    def test_simulate_basic(self):
+    def test_simulate_basic(self, run_sim):
         """Test basic simulation without correlation."""
-        initial_prices = {"AAPL": 150.0}
-        expected_returns = {"AAPL": 0.10}
-        volatilities = {"AAPL": 0.25}
-
-        mc_sim = MonteCarloSimulation(
-            initial_prices=initial_prices,
-            expected_returns=expected_returns,
-            volatilities=volatilities,
-        )
-
-        results = mc_sim.simulate(num_simulations=100, num_days=10, random_seed=42)
+        results = run_sim(("AAPL",), 100, 10, 42)
 
         assert "prices" in results
         assert "returns" in results
@@ -62,43 +50,59 @@ class TestMonteCarloSimulation:
             correlation_matrix=correlation_matrix,
         )
 
-        results = mc_sim.simulate(num_simulations=100, num_days=10, random_seed=42)
+        results = mc_sim.simulate(num_simulations=100, num_days=10, random_seed=42, store_full_paths=True)
 
         assert results["prices"].shape == (2, 100, 11)
 
-    def test_calculate_statistics(self):
-        """Test statistics calculation."""
-        initial_prices = {"AAPL": 150.0}
-        expected_returns = {"AAPL": 0.10}
-        volatilities = {"AAPL": 0.25}
+    def test_simulate_with_precomputed_cholesky(self, chol_2x2, monkeypatch):
+        """Test a supplied Cholesky factor is used as-is instead of refactoring the correlation matrix."""
+        rho = 0.7
+        # 2x2 Cholesky has the closed form [[1, 0], [rho, sqrt(1 - rho^2)]]
+        np.testing.assert_allclose(chol_2x2, [[1.0, 0.0], [rho, np.sqrt(1 - rho**2)]])
+
+        def fail(*args, **kwargs):
+            raise AssertionError("correlation matrix should not be refactored")
 
+        monkeypatch.setattr(monte_carlo, "cholesky", fail)
         mc_sim = MonteCarloSimulation(
-            initial_prices=initial_prices,
-            expected_returns=expected_returns,
-            volatilities=volatilities,
+            {"AAPL": 150.0, "MSFT": 250.0},
+            {"AAPL": 0.10, "MSFT": 0.12},
+            {"AAPL": 0.25, "MSFT": 0.30},
+            correlation_matrix=np.array([[1.0, rho], [rho, 1.0]]),
+            precomputed_cholesky=chol_2x2,
         )
 
+        np.testing.assert_allclose(mc_sim._base_cholesky, chol_2x2, rtol=1e-6)
         results = mc_sim.simulate(num_simulations=100, num_days=10, random_seed=42)
-        stats = mc_sim.calculate_statistics(results)
+        assert results["final_prices"].shape == (2, 100)
+
+    def test_calculate_statistics(self, mc_sim_single, run_sim):
+        """Test statistics calculation."""
+        results = run_sim(("AAPL",), 100, 10, 42)
+        stats = mc_sim_single.calculate_statistics(results)
 
         assert len(stats) == 1
         assert "ticker" in stats.columns
         assert "mean_final_price" in stats.columns
         assert "std_final_price" in stats.columns
 
-    def test_calculate_var(self):
-        """Test VaR calculation."""
-        initial_prices = {"AAPL": 150.0, "MSFT": 250.0}
-        expected_returns = {"AAPL": 0.10, "MSFT": 0.12}
-        volatilities = {"AAPL": 0.25, "MSFT": 0.30}
+    def test_calculate_statistics_per_asset(self, mc_sim_two_asset, run_sim):
+        """Test each statistics row is computed from its own asset's final prices."""
+        mc_sim = mc_sim_two_asset
+        results = run_sim(("AAPL", "MSFT"), 200, 60, 42)
+        stats = mc_sim.calculate_statistics(results)
 
-        mc_sim = MonteCarloSimulation(
-            initial_prices=initial_prices,
-            expected_returns=expected_returns,
-            volatilities=volatilities,
-        )
+        assert list(stats["ticker"]) == ["AAPL", "MSFT"]
+        for i, row in stats.iterrows():
+            final = results["final_prices"][i]
+            assert row["median_final_price"] == pytest.approx(np.median(final))
+            assert row["percentile_5"] == pytest.approx(np.percentile(final, 5))
+            assert row["probability_loss"] == pytest.approx(np.mean(final < mc_sim.initial_prices[i]))
 
-        results = mc_sim.simulate(num_simulations=1000, num_days=252, random_seed=42)
+    def test_calculate_var(self, mc_sim_two_asset, run_sim):
+        """Test VaR calculation."""
+        mc_sim = mc_sim_two_asset
+        results = run_sim(("AAPL", "MSFT"), 200, 60, 42)
         var_metrics = mc_sim.calculate_var(results, confidence_level=0.95)
 
         assert "var" in var_metrics
@@ -107,6 +111,15 @@ class TestMonteCarloSimulation:
         assert "probability_loss" in var_metrics
         assert var_metrics["var"] < 0  # VaR should be negative (loss)
 
+        # Equal-weight portfolio: average gross return across assets
+        portfolio_returns = (results["final_prices"] / mc_sim.initial_prices[:, np.newaxis]).mean(axis=0) - 1
+        assert var_metrics["mean_return"] == pytest.approx(portfolio_returns.mean(), rel=1e-5)
+
+        # Per-asset VaR keyed by ticker, never above the asset's CVaR
+        assert set(var_metrics["asset_var"]) == {"AAPL", "MSFT"}
+        for ticker in ("AAPL", "MSFT"):
+            assert var_metrics["asset_cvar"][ticker] <= var_metrics["asset_var"][ticker]
+
     def test_reproducibility(self):
         """Test that results are reproducible with same seed."""
         initial_prices = {"AAPL": 150.0}
@@ -125,7 +138,176 @@ class TestMonteCarloSimulation:
             volatilities=volatilities,
         )
 
-        results1 = mc_sim1.simulate(num_simulations=10, num_days=5, random_seed=42)
-        results2 = mc_sim2.simulate(num_simulations=10, num_days=5, random_seed=42)
+        results1 = mc_sim1.simulate(num_simulations=10, num_days=5, random_seed=42, store_full_paths=True)
+        results2 = mc_sim2.simulate(num_simulations=10, num_days=5, random_seed=42, store_full_paths=True)
+
+        np.testing.assert_array_equal(results1["prices"], results2["prices"])
+
+    def test_generate_correlated_shocks(self, chol_2x2):
+        """Test that correlated shocks apply the Cholesky factor to every column."""
+        initial_prices = {"AAPL": 150.0, "MSFT": 250.0}
+        expected_returns = {"AAPL": 0.10, "MSFT": 0.12}
+        volatilities = {"AAPL": 0.25, "MSFT": 0.30}
+        correlation_matrix = np.array([[1.0, 0.7], [0.7, 1.0]])
+        cholesky = chol_2x2
+
+        mc_sim = MonteCarloSimulation(
+            initial_prices, expected_returns, volatilities, correlation_matrix, dtype=np.float64
+        )
+
+        shocks = mc_sim._generate_correlated_shocks(2, 500, 20, cholesky, rng=np.random.default_rng(42))
+        independent = np.random.default_rng(42).standard_normal((2, 500, 20))
+
+        assert shocks.shape == (2, 500, 20)
+        np.testing.assert_allclose(shocks[:, 3, 7], cholesky @ independent[:, 3, 7])
+        assert np.corrcoef(shocks[0].ravel(), shocks[1].ravel())[0, 1] == pytest.approx(0.7, abs=0.05)
+
+    def test_returns_consistent_with_prices(self):
+        """Test that returned log returns reproduce the simulated price paths."""
+        initial_prices = {"AAPL": 150.0, "MSFT": 250.0}
+        expected_returns = {"AAPL": 0.10, "MSFT": 0.12}
+        volatilities = {"AAPL": 0.25, "MSFT": 0.30}
+        correlation_matrix = np.array([[1.0, 0.7], [0.7, 1.0]])
+
+        mc_sim = MonteCarloSimulation(
+            initial_prices, expected_returns, volatilities, correlation_matrix, dtype=np.float64
+        )
+        results = mc_sim.simulate(num_simulations=50, num_days=15, random_seed=42, store_full_paths=True)
+
+        np.testing.assert_allclose(np.diff(np.log(results["prices"]), axis=2), results["returns"], atol=1e-12)
+
+    def test_dtype(self):
+        """Test that paths are stored in the requested floating point type."""
+        initial_prices = {"AAPL": 150.0, "MSFT": 250.0}
+        expected_returns = {"AAPL": 0.10, "MSFT": 0.12}
+        volatilities = {"AAPL": 0.25, "MSFT": 0.30}
+        correlation_matrix = np.array([[1.0, 0.7], [0.7, 1.0]])
+
+        for regime_aware in (False, True):
+            mc32 = MonteCarloSimulation(initial_prices, expected_returns, volatilities, correlation_matrix)
+            mc64 = MonteCarloSimulation(
+                initial_prices, expected_returns, volatilities, correlation_matrix, dtype=np.float64
+            )
+            results32 = mc32.simulate(num_simulations=100, num_days=10, random_seed=42, regime_aware=regime_aware)
+            results64 = mc64.simulate(num_simulations=100, num_days=10, random_seed=42, regime_aware=regime_aware)
+
+            assert results32["final_prices"].dtype == np.float32
+            assert results32["returns"].dtype == np.float32
+            assert results64["final_prices"].dtype == np.float64
+            np.testing.assert_allclose(
+                results32["final_prices"].mean(axis=1), results64["final_prices"].mean(axis=1), rtol=0.03
+            )
+
+    def test_does_not_touch_global_rng(self):
+        """Test that seeding a simulation leaves numpy's global random state alone."""
+        mc_sim = MonteCarloSimulation({"AAPL": 150.0}, {"AAPL": 0.10}, {"AAPL": 0.25})
+
+        np.random.seed(0)
+        expected = np.random.random()
+        np.random.seed(0)
+        mc_sim.simulate(num_simulations=10, num_days=5, random_seed=1)
+
+        assert np.random.random() == expected
+
+    def test_full_paths_not_stored_by_default(self):
+        """Test that only final prices and sample paths are kept unless full paths are requested."""
+        initial_prices = {"AAPL": 150.0, "MSFT": 250.0}
+        expected_returns = {"AAPL": 0.10, "MSFT": 0.12}
+        volatilities = {"AAPL": 0.25, "MSFT": 0.30}
+        correlation_matrix = np.array([[1.0, 0.7], [0.7, 1.0]])
+
+        mc_sim = MonteCarloSimulation(
+            initial_prices, expected_returns, volatilities, correlation_matrix, dtype=np.float64
+        )
+
+        for regime_aware in (False, True):
+            lean = mc_sim.simulate(num_simulations=40, num_days=12, random_seed=3, regime_aware=regime_aware)
+            full = mc_sim.simulate(
+                num_simulations=40, num_days=12, random_seed=3, regime_aware=regime_aware, store_full_paths=True
+            )
+
+            assert "prices" not in lean
+            assert lean["sample_paths"].shape == (2, 10, 13)
+            np.testing.assert_allclose(lean["final_prices"], full["prices"][:, :, -1])
+            np.testing.assert_allclose(lean["sample_paths"], full["prices"][:, :10, :])
+
+        dfs = mc_sim.get_price_paths_df(lean, num_paths_to_show=5)
+        assert list(dfs) == ["AAPL", "MSFT"]
+        assert dfs["AAPL"].shape == (13, 6)
+
+    def test_simulate_into_workspace(self, mc_sim_two_asset):
+        """Test a preallocated workspace reproduces the allocating run and backs the returns tensor."""
+        workspace = np.empty(2 * 40 * 12 * 2, dtype=np.float64)
+
+        for regime_aware in (False, True):
+            expected = mc_sim_two_asset.simulate(
+                num_simulations=40, num_days=12, random_seed=5, regime_aware=regime_aware
+            )
+            results = mc_sim_two_asset.simulate(
+                num_simulations=40, num_days=12, random_seed=5, regime_aware=regime_aware, out=workspace
+            )
+
+            assert np.shares_memory(results["returns"], workspace)
+            np.testing.assert_array_equal(results["returns"], expected["returns"])
+            np.testing.assert_array_equal(results["final_prices"], expected["final_prices"])
+
+        with pytest.raises(ValueError):
+            mc_sim_two_asset.simulate(num_simulations=40, num_days=12, out=np.empty(10, dtype=np.float32))
+        with pytest.raises(ValueError):
+            mc_sim_two_asset.simulate(num_simulations=40, num_days=12, num_workers=2, out=workspace)
+
+    def test_device_validation(self, monkeypatch):
+        """Test unsupported device requests are rejected before simulating."""
+        mc_sim = MonteCarloSimulation({"AAPL": 150.0}, {"AAPL": 0.10}, {"AAPL": 0.25})
+
+        with pytest.raises(ValueError):
+            mc_sim.simulate(num_simulations=10, num_days=5, device="tpu")
+
+        monkeypatch.setattr(monte_carlo, "CUPY_AVAILABLE", False)
+        with pytest.raises(RuntimeError):
+            mc_sim.simulate(num_simulations=10, num_days=5, device="cuda")
+
+    def test_parallel_batches(self):
+        """Test worker batches reproduce the per-batch serial streams spawned from the seed."""
+        mc_sim = MonteCarloSimulation(
+            {"AAPL": 150.0, "MSFT": 250.0},
+            {"AAPL": 0.10, "MSFT": 0.12},
+            {"AAPL": 0.25, "MSFT": 0.30},
+            np.array([[1.0, 0.7], [0.7, 1.0]]),
+            dtype=np.float64,
+        )
+
+        results = mc_sim.simulate(num_simulations=25, num_days=8, random_seed=11, num_workers=2)
+
+        assert results["final_prices"].shape == (2, 25)
+        assert results["sample_paths"].shape == (2, 10, 9)
+        assert "returns" not in results
+
+        # Spawned workers must not inherit a live Numba thread pool from an earlier regime-aware run
+        regime = mc_sim.simulate(num_simulations=25, num_days=8, random_seed=11, regime_aware=True, num_workers=2)
+        assert regime["final_prices"].shape == (2, 25)
+
+        first_seed, second_seed = np.random.SeedSequence(11).spawn(2)
+        first = mc_sim.simulate(num_simulations=13, num_days=8, random_seed=first_seed)
+        second = mc_sim.simulate(num_simulations=12, num_days=8, random_seed=second_seed)
+        np.testing.assert_allclose(
+            results["final_prices"], np.concatenate([first["final_prices"], second["final_prices"]], axis=1)
+        )
+        np.testing.assert_allclose(results["sample_paths"], first["sample_paths"])
+
+    def test_cuda_matches_cpu_distribution(self):
+        """Test GPU paths have the same layout and moments as CPU paths."""
+        pytest.importorskip("cupy")
+        mc_sim = MonteCarloSimulation(
+            {"AAPL": 150.0, "MSFT": 250.0},
+            {"AAPL": 0.10, "MSFT": 0.12},
+            {"AAPL": 0.25, "MSFT": 0.30},
+            np.array([[1.0, 0.7], [0.7, 1.0]]),
+        )
+
+        cpu = mc_sim.simulate(num_simulations=20000, num_days=20, random_seed=1)
+        gpu = mc_sim.simulate(num_simulations=20000, num_days=20, random_seed=1, device="cuda")
 
-        assert np.allclose(results1["prices"], results2["prices"])
+        assert gpu["final_prices"].shape == cpu["final_prices"].shape
+        assert gpu["sample_paths"].shape == cpu["sample_paths"].shape
+        np.testing.assert_allclose(gpu["final_prices"].mean(axis=1), cpu["final_prices"].mean(axis=1), rtol=0.02)
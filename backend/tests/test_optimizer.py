@@ -4,19 +4,37 @@ import pytest
 from backend.simulation.optimizer import PortfolioOptimizer
 
 
-@pytest.fixture
-def mock_portfolio_data():
-    """Create basic data for testing optimization."""
+@pytest.fixture(params=[0.0, 0.3, 0.7], ids=lambda rho: f"rho={rho}")
+def mock_portfolio_data(request):
+    """Create basic data for testing optimization with a constant pairwise correlation."""
     expected_returns = {"SPY": 0.10, "TLT": 0.04, "GLD": 0.02}  # 10%  # 4%  # 2%
 
-    # 3x3 correlation matrix (identity = no correlation)
-    correlation_matrix = np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+    # 3x3 constant-correlation matrix (rho = 0 is the identity = no correlation)
+    correlation_matrix = np.full((3, 3), request.param)
+    np.fill_diagonal(correlation_matrix, 1.0)
 
     volatilities = {"SPY": 0.20, "TLT": 0.10, "GLD": 0.15}  # 20%  # 10%  # 15%
 
     return expected_returns, correlation_matrix, volatilities
 
 
+def _constant_rho_cholesky(n, rho):
+    """Closed-form Cholesky factor of an n x n constant-correlation matrix.
+
+    Column j has diagonal d_j and a constant sub-diagonal l_j, with d_0 = 1, l_0 = rho,
+    d_j = sqrt(d_{j-1}^2 - l_{j-1}^2) and l_j = (rho - 1) / d_j + d_j.
+    """
+    lower = np.zeros((n, n))
+    d, sub = 1.0, rho
+    for j in range(n):
+        if j > 0:
+            d = np.sqrt(d**2 - sub**2)
+            sub = (rho - 1) / d + d
+        lower[j, j] = d
+        lower[j + 1 :, j] = sub
+    return lower
+
+
 def test_optimizer_init(mock_portfolio_data):
     """Test initialization and covariance calculation."""
     expected_returns, correlation_matrix, volatilities = mock_portfolio_data
@@ -29,8 +47,13 @@ def test_optimizer_init(mock_portfolio_data):
     assert pytest.approx(optimizer.covariance[0, 0]) == 0.04
     # Covariance for TLT should be 0.1 * 0.1 = 0.01
     assert pytest.approx(optimizer.covariance[1, 1]) == 0.01
-    # Off-diagonals should be 0
-    assert optimizer.covariance[0, 1] == 0
+    # Off-diagonals are rho * vol_i * vol_j (0 for the identity)
+    rho = correlation_matrix[0, 1]
+    assert pytest.approx(optimizer.covariance[0, 1], abs=1e-15) == rho * 0.2 * 0.1
+
+    # Covariance factor is Diag(vols) times the closed-form constant-rho Cholesky factor
+    expected_chol = np.diag([0.20, 0.10, 0.15]) @ _constant_rho_cholesky(3, rho)
+    np.testing.assert_allclose(optimizer._chol_cov, expected_chol, atol=1e-9)
 
 
 def test_max_sharpe(mock_portfolio_data):
@@ -64,7 +87,7 @@ def test_min_vol(mock_portfolio_data):
     # TLT has the lowest volatility (10%), so it should have the highest weight
     assert result["weights"]["TLT"] > result["weights"]["SPY"]
     assert result["weights"]["TLT"] > result["weights"]["GLD"]
-    assert result["volatility"] <= 0.10
+    assert result["volatility"] <= 0.10 + 1e-9  # all-TLT is optimal once correlations are high
 
 
 def test_portfolio_performance(mock_portfolio_data):
@@ -81,3 +104,49 @@ def test_portfolio_performance(mock_portfolio_data):
     assert vol > 0
     assert pytest.approx(sharpe) == ret / vol
     assert es < ret  # ES should be worse than mean return
+
+
+def test_portfolio_volatility_matches_quadratic_form():
+    """Test the Cholesky-based volatility against sqrt(w' Cov w) for a correlated portfolio."""
+    expected_returns = {"SPY": 0.10, "TLT": 0.04, "GLD": 0.02}
+    volatilities = {"SPY": 0.20, "TLT": 0.10, "GLD": 0.15}
+    correlation_matrix = np.array([[1.0, -0.3, 0.1], [-0.3, 1.0, 0.2], [0.1, 0.2, 1.0]])
+    optimizer = PortfolioOptimizer(expected_returns, correlation_matrix, volatilities)
+
+    weights = np.array([0.5, 0.3, 0.2])
+    _, vol, _, _ = optimizer.portfolio_performance(weights)
+
+    assert pytest.approx(vol) == np.sqrt(weights @ optimizer.covariance @ weights)
+
+
+def test_analytic_gradients(mock_portfolio_data):
+    """Test analytic objective gradients against central finite differences for each correlation level."""
+    expected_returns, correlation_matrix, volatilities = mock_portfolio_data
+    optimizer = PortfolioOptimizer(expected_returns, correlation_matrix, volatilities)
+
+    weights = np.array([0.5, 0.3, 0.2])
+    eps = 1e-6
+    for objective, jac in [
+        (optimizer._port_vol, optimizer._port_vol_jac),
+        (optimizer._neg_sharpe, optimizer._neg_sharpe_jac),
+    ]:
+        numeric = np.array(
+            [(objective(weights + eps * e) - objective(weights - eps * e)) / (2 * eps) for e in np.eye(3)]
+        )
+        np.testing.assert_allclose(jac(weights), numeric, rtol=1e-5, atol=1e-8)
+
+
+def test_indefinite_correlation_is_repaired():
+    """Test a slightly indefinite (e.g. user-stressed) correlation matrix is made positive definite."""
+    expected_returns = {"SPY": 0.10, "TLT": 0.04, "GLD": 0.02}
+    volatilities = {"SPY": 0.20, "TLT": 0.10, "GLD": 0.15}
+    correlation_matrix = np.array([[1.0, 0.9, -0.9], [0.9, 1.0, 0.9], [-0.9, 0.9, 1.0]])
+    assert np.linalg.eigvalsh(correlation_matrix).min() < 0
+
+    optimizer = PortfolioOptimizer(expected_returns, correlation_matrix, volatilities)
+
+    assert np.linalg.eigvalsh(optimizer.covariance).min() > 0
+    np.testing.assert_allclose(np.diag(optimizer.covariance), [0.04, 0.01, 0.0225])
+    result = optimizer.optimize_minimum_volatility()
+    assert result["success"] is True
+    assert result["volatility"] > 0
@@ -1,8 +1,18 @@
 import numpy as np
+import pytest
 
+from backend.simulation import monte_carlo
 from backend.simulation.monte_carlo import MonteCarloSimulation
 
 
+def _pearson(x, y):
+    """Pearson correlation of two 1D samples as a normalized dot product."""
+    x = x - x.mean()
+    y = y - y.mean()
+    return float(x @ y / (np.linalg.norm(x) * np.linalg.norm(y)))
+
+
+@pytest.mark.slow
 def test_regime_aware_convergence():
     initial_prices = {"A": 100, "B": 100}
     # Zero returns, high-ish volatility
@@ -16,14 +26,31 @@ def test_regime_aware_convergence():
     # Run Normal
     results_normal = mc.simulate(num_simulations=1000, num_days=20, random_seed=42, regime_aware=False)
     returns_normal = results_normal["returns"]
-    corr_normal = np.corrcoef(returns_normal[0].flatten(), returns_normal[1].flatten())[0, 1]
+    corr_normal = _pearson(returns_normal[0].ravel(), returns_normal[1].ravel())
 
     # Run Regime-Aware
     results_regime = mc.simulate(num_simulations=1000, num_days=20, random_seed=42, regime_aware=True)
     returns_regime = results_regime["returns"]
-    corr_regime = np.corrcoef(returns_regime[0].flatten(), returns_regime[1].flatten())[0, 1]
+    corr_regime = _pearson(returns_regime[0].ravel(), returns_regime[1].ravel())
 
     # In regime-aware, correlation should have drifted upward due to stress paths
     # Note: We use the same seed, so the shocks are the same, but the transformation changes.
     assert corr_regime > corr_normal
     print(f"Normal Corr: {corr_normal:.4f}, Regime-Aware Corr: {corr_regime:.4f}")
+
+
+def test_regime_aware_kernel_matches_numpy(monkeypatch):
+    pytest.importorskip("numba")
+
+    initial_prices = {"A": 100, "B": 100, "C": 50}
+    expected_returns = {"A": -0.2, "B": 0.0, "C": 0.1}
+    volatilities = {"A": 0.5, "B": 0.4, "C": 0.3}
+    correlation_matrix = np.array([[1.0, 0.2, 0.1], [0.2, 1.0, -0.1], [0.1, -0.1, 1.0]])
+
+    mc = MonteCarloSimulation(initial_prices, expected_returns, volatilities, correlation_matrix, dtype=np.float64)
+    jit_results = mc.simulate(num_simulations=200, num_days=30, random_seed=7, regime_aware=True)
+
+    monkeypatch.setattr(monte_carlo, "NUMBA_AVAILABLE", False)
+    numpy_results = mc.simulate(num_simulations=200, num_days=30, random_seed=7, regime_aware=True)
+
+    np.testing.assert_allclose(jit_results["returns"], numpy_results["returns"], rtol=1e-9, atol=1e-12)
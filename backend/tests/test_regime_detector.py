@@ -8,16 +8,16 @@ from backend.simulation.regime_detector import RegimeDetector
 
 def _make_returns(n=500, seed=42):
     """Generate synthetic return data with different market phases."""
-    np.random.seed(seed)
+    rng = np.random.default_rng(seed)
 
     # Bull: low vol, positive drift
-    bull = np.random.normal(0.0008, 0.008, 200)
+    bull = rng.normal(0.0008, 0.008, 200)
     # Crisis: very negative, high vol
-    crisis = np.random.normal(-0.015, 0.035, 50)
+    crisis = rng.normal(-0.015, 0.035, 50)
     # Recovery: positive drift, high vol
-    recovery = np.random.normal(0.003, 0.020, 100)
+    recovery = rng.normal(0.003, 0.020, 100)
     # Bear: slight negative, moderate vol
-    bear = np.random.normal(-0.002, 0.015, 150)
+    bear = rng.normal(-0.002, 0.015, 150)
 
     returns = np.concatenate([bull, crisis, recovery, bear])
     dates = pd.date_range("2020-01-01", periods=len(returns), freq="B")
@@ -102,13 +102,13 @@ class TestRegimeSummary:
 
     def test_multi_asset(self):
         """Detector should handle multi-column DataFrames."""
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         n = 300
         dates = pd.date_range("2020-01-01", periods=n, freq="B")
         df = pd.DataFrame(
             {
-                "SPY": np.random.normal(0.0005, 0.01, n),
-                "TLT": np.random.normal(0.0002, 0.005, n),
+                "SPY": rng.normal(0.0005, 0.01, n),
+                "TLT": rng.normal(0.0002, 0.005, n),
             },
             index=dates,
         )
@@ -89,8 +89,7 @@ class TestTailRiskIndex:
 
     def test_normal_distribution(self):
         """Normal distribution tail risk index should be close to 1."""
-        np.random.seed(42)
-        returns = np.random.normal(0, 0.01, 10000)
+        returns = np.random.default_rng(42).normal(0, 0.01, 10000)
         tri = RiskMetrics.tail_risk_index(returns)
         # For normal distribution, CVaR/VaR ≈ 1.15-1.25
         assert 1.0 <= tri <= 1.5
@@ -5,88 +5,107 @@ import pytest
 from backend.scenarios.predefined_scenarios import PredefinedScenarios
 
 
-class TestPredefinedScenarios:
-    """Test cases for predefined scenarios."""
-
-    def test_get_2008_financial_crisis(self):
-        """Test 2008 financial crisis scenario."""
-        scenario = PredefinedScenarios.get_2008_financial_crisis()
-
-        assert scenario["name"] == "2008 Financial Crisis"
-        assert scenario["category"] == "market_crash"
-        assert scenario["is_predefined"] is True
-        assert "parameters" in scenario
-        assert "return_shocks" in scenario["parameters"]
-        assert "volatility_multipliers" in scenario["parameters"]
-        assert "correlation_multiplier" in scenario["parameters"]
-
-        # Check severe equity decline
-        assert scenario["parameters"]["return_shocks"]["SPY"] < -0.4
-
-        # Check bond rally
-        assert scenario["parameters"]["return_shocks"]["TLT"] > 0
-
-    def test_get_covid19_crash(self):
-        """Test COVID-19 crash scenario."""
-        scenario = PredefinedScenarios.get_covid19_crash()
-
-        assert scenario["name"] == "COVID-19 Market Crash"
-        assert scenario["category"] == "market_crash"
-        assert "pandemic" in scenario["tags"]
-
-        # Check oil collapse
-        assert scenario["parameters"]["return_shocks"]["USO"] < -0.5
-
-    def test_get_interest_rate_shock(self):
-        """Test interest rate shock scenario."""
-        scenario = PredefinedScenarios.get_interest_rate_shock()
+@pytest.fixture(scope="module")
+def all_scenarios():
+    """All predefined scenarios, built once for the module."""
+    return PredefinedScenarios.get_all_scenarios()
 
-        assert scenario["name"] == "Interest Rate Shock (+200 bps)"
-        assert scenario["category"] == "rate_shock"
 
-        # Check bond decline
-        assert scenario["parameters"]["return_shocks"]["TLT"] < 0
-        assert scenario["parameters"]["return_shocks"]["IEF"] < 0
+def _shocks(scenario):
+    return scenario["parameters"]["return_shocks"]
 
-    def test_get_oil_price_shock(self):
-        """Test oil price shock scenario."""
-        scenario = PredefinedScenarios.get_oil_price_shock()
 
-        assert scenario["name"] == "Oil Price Shock (+100%)"
-        assert scenario["category"] == "commodity_shock"
-
-        # Check oil price increase
-        assert scenario["parameters"]["return_shocks"]["USO"] > 0.5
-
-    def test_get_volatility_spike(self):
-        """Test volatility spike scenario."""
-        scenario = PredefinedScenarios.get_volatility_spike()
-
-        assert scenario["name"] == "Volatility Spike"
-        assert scenario["category"] == "volatility_spike"
-
-        # Check high volatility multipliers
-        assert all(v >= 1.9 for v in scenario["parameters"]["volatility_multipliers"].values())
-
-    def test_get_currency_crisis(self):
-        """Test currency crisis scenario."""
-        scenario = PredefinedScenarios.get_currency_crisis()
-
-        assert scenario["name"] == "Currency Crisis"
-        assert scenario["category"] == "currency_crisis"
-
-        # Check currency weakness
-        if "EURUSD=X" in scenario["parameters"]["return_shocks"]:
-            assert scenario["parameters"]["return_shocks"]["EURUSD=X"] < 0
+class TestPredefinedScenarios:
+    """Test cases for predefined scenarios."""
 
-    def test_get_all_scenarios(self):
+    @pytest.mark.parametrize(
+        "getter,name,category,check",
+        [
+            (
+                PredefinedScenarios.get_2008_financial_crisis,
+                "2008 Financial Crisis",
+                "market_crash",
+                # Severe equity decline and bond rally
+                lambda s: s["is_predefined"] is True
+                and {"return_shocks", "volatility_multipliers", "correlation_multiplier"} <= set(s["parameters"])
+                and _shocks(s)["SPY"] < -0.4
+                and _shocks(s)["TLT"] > 0,
+            ),
+            (
+                PredefinedScenarios.get_covid19_crash,
+                "COVID-19 Market Crash",
+                "market_crash",
+                # Oil collapse
+                lambda s: "pandemic" in s["tags"] and _shocks(s)["USO"] < -0.5,
+            ),
+            (
+                PredefinedScenarios.get_interest_rate_shock,
+                "Interest Rate Shock (+200 bps)",
+                "rate_shock",
+                # Bond decline
+                lambda s: _shocks(s)["TLT"] < 0 and _shocks(s)["IEF"] < 0,
+            ),
+            (
+                PredefinedScenarios.get_oil_price_shock,
+                "Oil Price Shock (+100%)",
+                "commodity_shock",
+                # Oil price increase
+                lambda s: _shocks(s)["USO"] > 0.5,
+            ),
+            (
+                PredefinedScenarios.get_volatility_spike,
+                "Volatility Spike",
+                "volatility_spike",
+                # High volatility multipliers
+                lambda s: all(v >= 1.9 for v in s["parameters"]["volatility_multipliers"].values()),
+            ),
+            (
+                PredefinedScenarios.get_currency_crisis,
+                "Currency Crisis",
+                "currency_crisis",
+                # Currency weakness
+                lambda s: _shocks(s).get("EURUSD=X", -1.0) < 0,
+            ),
+        ],
+        ids=[
+            "2008_financial_crisis",
+            "covid19_crash",
+            "interest_rate_shock",
+            "oil_price_shock",
+            "volatility_spike",
+            "currency_crisis",
+        ],
+    )
+    def test_get_scenario(self, getter, name, category, check):
+        """Test each predefined scenario getter."""
+        scenario = getter()
+
+        assert scenario["name"] == name
+        assert scenario["category"] == category
+        assert check(scenario)
+
+    def test_get_all_scenarios(self, all_scenarios):
         """Test getting all scenarios."""
-        scenarios = PredefinedScenarios.get_all_scenarios()
-
-        assert len(scenarios) == 6
-        assert all("name" in s for s in scenarios)
-        assert all("parameters" in s for s in scenarios)
-        assert all("is_predefined" in s for s in scenarios)
+        assert len(all_scenarios) == 6
+        assert all("name" in s for s in all_scenarios)
+        assert all("parameters" in s for s in all_scenarios)
+        assert all("is_predefined" in s for s in all_scenarios)
+
+    def test_get_all_scenarios_cached_and_read_only(self, all_scenarios):
+        """Test scenarios are built once and cannot be mutated by callers."""
+        assert PredefinedScenarios.get_all_scenarios() is all_scenarios
+
+        scenario = all_scenarios[0]
+        with pytest.raises(TypeError):
+            scenario["name"] = "changed"
+        with pytest.raises(TypeError):
+            _shocks(scenario)["SPY"] = 0.0
+
+        copy = PredefinedScenarios.to_dict(scenario)
+        copy["parameters"]["return_shocks"]["SPY"] = 0.0
+        copy["tags"].append("edited")
+        assert _shocks(scenario)["SPY"] == -0.50
+        assert "edited" not in scenario["tags"]
 
     def test_get_scenario_by_name(self):
         """Test getting scenario by name."""
@@ -99,10 +118,8 @@ class TestPredefinedScenarios:
         with pytest.raises(ValueError, match="not found"):
             PredefinedScenarios.get_scenario_by_name("Non-existent Scenario")
 
-    def test_all_scenarios_have_required_fields(self):
+    def test_all_scenarios_have_required_fields(self, all_scenarios):
         """Test that all scenarios have required fields."""
-        scenarios = PredefinedScenarios.get_all_scenarios()
-
         required_fields = [
             "name",
             "description",
@@ -112,7 +129,7 @@ class TestPredefinedScenarios:
             "is_predefined",
         ]
 
-        for scenario in scenarios:
+        for scenario in all_scenarios:
             for field in required_fields:
                 assert field in scenario, f"Scenario '{scenario.get('name')}' missing field '{field}'"
 
@@ -2,32 +2,43 @@
 
 import numpy as np
 import pandas as pd
+import pytest
 
 from backend.data_ingestion.transformers import DataTransformer
 
 
-class TestDataTransformer:
-    """Test cases for DataTransformer class."""
+@pytest.fixture(scope="module")
+def transform_df():
+    """Small price/value frame shared by the returns and normalization tests."""
+    return pd.DataFrame({"close": [100.0, 110.0, 105.0, 115.0], "value": [1.0, 2.0, 3.0, 4.0]})
 
-    def test_calculate_returns_log(self):
-        """Test log returns calculation."""
-        df = pd.DataFrame({"close": [100, 110, 105, 115]})
 
-        result = DataTransformer.calculate_returns(df, method="log")
+@pytest.fixture(scope="module")
+def close_prices():
+    """Monotonic 250-day close series for the technical-indicator test."""
+    return np.arange(100, 350, dtype=np.float64)
 
-        assert "returns" in result.columns
-        assert pd.isna(result["returns"].iloc[0])  # First value should be NaN
-        assert not pd.isna(result["returns"].iloc[1])
 
-    def test_calculate_returns_simple(self):
-        """Test simple returns calculation."""
-        df = pd.DataFrame({"close": [100, 110, 105, 115]})
+@pytest.fixture(scope="session")
+def vol_returns(tmp_path_factory):
+    """Seeded daily returns saved once to .npy and memory-mapped back read-only."""
+    path = tmp_path_factory.mktemp("data") / "returns.npy"
+    if not path.exists():
+        np.save(path, np.random.default_rng(42).normal(0, 0.01, 100))
+    return np.load(path, mmap_mode="r")
 
-        result = DataTransformer.calculate_returns(df, method="simple")
+
+class TestDataTransformer:
+    """Test cases for DataTransformer class."""
+
+    @pytest.mark.parametrize("method,expected", [("log", np.log(1.1)), ("simple", 0.1)])
+    def test_calculate_returns(self, transform_df, method, expected):
+        """Test log and simple returns calculation."""
+        result = DataTransformer.calculate_returns(transform_df, method=method)
 
         assert "returns" in result.columns
-        assert pd.isna(result["returns"].iloc[0])
-        assert abs(result["returns"].iloc[1] - 0.1) < 0.001  # 10% return
+        assert pd.isna(result["returns"].iloc[0])  # First value should be NaN
+        assert result["returns"].iloc[1] == pytest.approx(expected)
 
     def test_handle_missing_values_ffill(self):
         """Test forward fill for missing values."""
@@ -47,31 +58,25 @@ class TestDataTransformer:
         assert result["value"].isna().sum() == 0
         assert result["value"].iloc[2] == 3
 
-    def test_normalize_data_zscore(self):
+    def test_normalize_data_zscore(self, transform_df):
         """Test z-score normalization."""
-        df = pd.DataFrame({"value": [1, 2, 3, 4, 5]})
+        result = DataTransformer.normalize_data(transform_df, columns=["value"], method="zscore")
 
-        result = DataTransformer.normalize_data(df, columns=["value"], method="zscore")
+        normalized = result["value_normalized"]
+        assert abs(normalized.mean()) < 0.001  # Mean should be ~0
+        assert abs(normalized.std() - 1.0) < 0.001  # Std should be ~1
 
-        assert "value_normalized" in result.columns
-        assert abs(result["value_normalized"].mean()) < 0.001  # Mean should be ~0
-        assert abs(result["value_normalized"].std() - 1.0) < 0.001  # Std should be ~1
-
-    def test_normalize_data_minmax(self):
+    def test_normalize_data_minmax(self, transform_df):
         """Test min-max normalization."""
-        df = pd.DataFrame({"value": [1, 2, 3, 4, 5]})
-
-        result = DataTransformer.normalize_data(df, columns=["value"], method="minmax")
+        result = DataTransformer.normalize_data(transform_df, columns=["value"], method="minmax")
 
-        assert "value_normalized" in result.columns
-        assert result["value_normalized"].min() == 0
-        assert result["value_normalized"].max() == 1
+        normalized = result["value_normalized"]
+        assert normalized.min() == 0
+        assert normalized.max() == 1
 
-    def test_calculate_volatility(self):
+    def test_calculate_volatility(self, vol_returns):
         """Test volatility calculation."""
-        np.random.seed(42)
-        returns = np.random.normal(0, 0.01, 100)
-        df = pd.DataFrame({"returns": returns})
+        df = pd.DataFrame({"returns": vol_returns})
 
         result = DataTransformer.calculate_volatility(df, window=21, annualize=True)
 
@@ -84,11 +89,11 @@ class TestDataTransformer:
         df = pd.DataFrame(
             {
                 "date": dates,
-                "open": range(100, 110),
-                "high": range(105, 115),
-                "low": range(95, 105),
-                "close": range(102, 112),
-                "volume": [1000] * 10,
+                "open": np.arange(100, 110, dtype=np.int64),
+                "high": np.arange(105, 115, dtype=np.int64),
+                "low": np.arange(95, 105, dtype=np.int64),
+                "close": np.arange(102, 112, dtype=np.int64),
+                "volume": np.full(10, 1000, dtype=np.int64),
             }
         )
 
@@ -97,9 +102,9 @@ class TestDataTransformer:
         assert len(result) < len(df)
         assert "close" in result.columns
 
-    def test_add_technical_indicators(self):
+    def test_add_technical_indicators(self, close_prices):
         """Test adding technical indicators."""
-        df = pd.DataFrame({"close": [100 + i for i in range(250)]})
+        df = pd.DataFrame({"close": close_prices})
 
         result = DataTransformer.add_technical_indicators(df)
 
@@ -0,0 +1,59 @@
+"""Tests for shared simulation utilities."""
+
+import os
+
+import numpy as np
+import pytest
+
+from backend.simulation.utils import (
+    THREAD_LIMIT_ENV_VARS,
+    asset_var_cvar,
+    lower_triangular_matmul,
+    tail_var_cvar,
+    worker_process_pool,
+)
+
+
+def test_lower_triangular_matmul():
+    """Test the trmm-based product against a dense matmul."""
+    lower = np.linalg.cholesky(np.array([[1.0, 0.5, 0.2], [0.5, 1.0, 0.3], [0.2, 0.3, 1.0]]))
+    x = np.random.default_rng(0).standard_normal((3, 50))
+    expected = lower @ x
+
+    np.testing.assert_allclose(lower_triangular_matmul(lower, x), expected)
+    np.testing.assert_allclose(lower_triangular_matmul(lower, x.copy(), overwrite=True), expected)
+    np.testing.assert_allclose(lower_triangular_matmul(lower, x[:, ::2]), expected[:, ::2])
+
+
+def test_tail_var_cvar():
+    """Test partition-based VaR/CVaR against the sorted sample."""
+    returns = np.random.default_rng(1).standard_normal(1001)
+    ordered = np.sort(returns)
+
+    var, cvar = tail_var_cvar(returns, 0.95)
+
+    assert var == ordered[50]
+    assert cvar == pytest.approx(ordered[:51].mean())
+    assert tail_var_cvar(returns, 1.0) == (ordered[0], ordered[0])
+
+
+def test_asset_var_cvar():
+    """Test per-asset VaR/CVaR rows against a sort of each asset's sample."""
+    returns = np.random.default_rng(2).standard_normal((3, 1001))
+    ordered = np.sort(returns, axis=1)
+
+    var, cvar = asset_var_cvar(returns, 0.95)
+
+    # Lower 5th percentile of 1001 samples is the order statistic at index floor(0.05 * 1000)
+    np.testing.assert_array_equal(var, ordered[:, 50])
+    np.testing.assert_allclose(cvar, ordered[:, :51].mean(axis=1))
+
+
+def test_worker_process_pool_limits_threads():
+    """Test spawned workers run single-threaded and the parent environment is restored."""
+    before = {var: os.environ.get(var) for var in THREAD_LIMIT_ENV_VARS}
+
+    with worker_process_pool(1) as executor:
+        assert list(executor.map(os.getenv, THREAD_LIMIT_ENV_VARS)) == ["1"] * len(THREAD_LIMIT_ENV_VARS)
+
+    assert {var: os.environ.get(var) for var in THREAD_LIMIT_ENV_VARS} == before
@@ -1,7 +1,10 @@
 """Tests for data validators."""
 
+import numpy as np
 import pandas as pd
+import pytest
 
+from backend.data_ingestion import validators
 from backend.data_ingestion.validators import DataValidator
 
 
@@ -24,6 +27,12 @@ class TestDataValidator:
         assert is_valid is False
         assert "b" in problematic
 
+    def test_check_missing_values_empty(self):
+        """Test missing values check on an empty frame."""
+        is_valid, problematic = DataValidator.check_missing_values(pd.DataFrame(columns=["a", "b"]))
+        assert is_valid is True
+        assert problematic == []
+
     def test_check_duplicates_pass(self):
         """Test duplicate check with no duplicates."""
         df = pd.DataFrame(
@@ -52,6 +61,20 @@ class TestDataValidator:
         assert is_valid is False
         assert count == 1
 
+    def test_check_duplicates_categorical_keys(self):
+        """Test duplicate check ignores unobserved category combinations."""
+        df = pd.DataFrame(
+            {
+                "ticker": pd.Categorical(["AAPL", "AAPL", "GOOGL"], categories=["AAPL", "GOOGL", "MSFT"]),
+                "date": pd.Categorical(["2024-01-01", "2024-01-01", "2024-01-02"]),
+                "close": [150, 150, 350],
+            }
+        )
+
+        is_valid, count = DataValidator.check_duplicates(df, subset=["ticker", "date"])
+        assert is_valid is False
+        assert count == 1
+
     def test_validate_price_data_pass(self):
         """Test price data validation with valid data."""
         df = pd.DataFrame(
@@ -68,6 +91,22 @@ class TestDataValidator:
         assert is_valid is True
         assert len(errors) == 0
 
+    def test_validate_price_data_object_columns(self):
+        """Test object-dtype price columns are validated on the typed array path."""
+        df = pd.DataFrame(
+            {
+                "open": [100, 101, 102],
+                "high": [105, 106, 107],
+                "low": [99, 100, 101],
+                "close": [103, 104, 105],
+            },
+            dtype=object,
+        )
+
+        is_valid, errors = DataValidator.validate_price_data(df)
+        assert is_valid is True
+        assert errors == []
+
     def test_validate_price_data_fail_negative(self):
         """Test price data validation with negative prices."""
         df = pd.DataFrame(
@@ -81,7 +120,7 @@ class TestDataValidator:
 
         is_valid, errors = DataValidator.validate_price_data(df)
         assert is_valid is False
-        assert len(errors) > 0
+        assert errors[0] == "Negative values found in ['open'] at rows [1]"
 
     def test_validate_price_data_fail_ohlc(self):
         """Test price data validation with invalid OHLC relationships."""
@@ -96,7 +135,7 @@ class TestDataValidator:
 
         is_valid, errors = DataValidator.validate_price_data(df)
         assert is_valid is False
-        assert len(errors) > 0
+        assert errors == ["OHLC violation at rows [0]"]
 
     def test_check_outliers_iqr(self):
         """Test outlier detection using IQR method."""
@@ -113,3 +152,30 @@ class TestDataValidator:
         has_no_outliers, outliers = DataValidator.check_outliers(df, "value", method="zscore", threshold=2.0)
         assert has_no_outliers is False
         assert outliers.sum() > 0
+
+    def test_check_outliers_with_missing_values(self):
+        """Test outlier masks skip missing values and cover every row of the frame."""
+        df = pd.DataFrame({"value": [1, 2, None, 3, 4, 5, 100]})
+
+        for method, threshold in (("iqr", 3.0), ("zscore", 2.0)):
+            has_no_outliers, outliers = DataValidator.check_outliers(df, "value", method=method, threshold=threshold)
+            assert has_no_outliers is False
+            assert outliers.index.equals(df.index)
+            assert outliers.tolist() == [False] * 6 + [True]
+
+
+@pytest.mark.skipif(not validators.NUMBA_AVAILABLE, reason="numba not installed")
+def test_ohlc_numba_kernel_matches_numpy(monkeypatch):
+    """Test the fused Numba OHLC kernel flags exactly the rows the NumPy expression does."""
+    rng = np.random.default_rng(7)
+    prices = rng.uniform(90, 110, size=(1000, 4))
+    prices[::7, 1] = prices[::7, 2] - 1  # high below low
+    prices[::11, 2] = np.nan
+
+    np.testing.assert_array_equal(validators._ohlc_violations_numba(prices), validators._ohlc_violations_numpy(prices))
+
+    monkeypatch.setattr(validators, "NUMBA_MIN_ROWS", 0)
+    df = pd.DataFrame(prices, columns=["open", "high", "low", "close"])
+    is_valid, errors = DataValidator.validate_price_data(df)
+    assert is_valid is False
+    assert errors[0].startswith("OHLC violation at rows [")
@@ -7,10 +7,10 @@ from backend.simulation.vol_term_structure import VolatilityTermStructure
 
 
 def _make_returns(n=300, seed=42):
-    np.random.seed(seed)
+    rng = np.random.default_rng(seed)
     dates = pd.date_range("2022-01-01", periods=n, freq="B")
     return pd.DataFrame(
-        {"SPY": np.random.normal(0.0004, 0.012, n), "TLT": np.random.normal(0.0001, 0.008, n)},
+        {"SPY": rng.normal(0.0004, 0.012, n), "TLT": rng.normal(0.0001, 0.008, n)},
         index=dates,
     )
 
@@ -19,12 +19,14 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+SEPARATOR = "=" * 60
+
 
 def main():
     """Main function to initialize database and ingest data."""
-    logger.info("=" * 60)
+    logger.info(SEPARATOR)
     logger.info("Cross-Asset Stress Scenario Simulator - Data Ingestion")
-    logger.info("=" * 60)
+    logger.info(SEPARATOR)
     
     # Create database tables
     logger.info("\n[1/2] Creating database tables...")
@@ -32,7 +34,7 @@ def main():
         db_manager.create_tables()
         logger.info("✓ Database tables created successfully")
     except Exception as e:
-        logger.error(f"✗ Failed to create database tables: {e}")
+        logger.error("✗ Failed to create database tables: %s", e)
         return
     
     # Run data ingestion
@@ -43,18 +45,18 @@ def main():
         with db_manager.get_session() as db:
             results = ingestion_service.run_full_ingestion(db)
         
-        logger.info("\n" + "=" * 60)
+        logger.info("\n%s", SEPARATOR)
         logger.info("Data Ingestion Results:")
-        logger.info("=" * 60)
+        logger.info(SEPARATOR)
         for key, value in results.items():
-            logger.info(f"  {key:.<40} {value:>6} records")
-        logger.info("=" * 60)
+            logger.info("  %-40s %6d records", key, value)
+        logger.info(SEPARATOR)
         
         total_records = sum(results.values())
-        logger.info(f"\n✓ Total records inserted: {total_records}")
+        logger.info("\n✓ Total records inserted: %d", total_records)
         
     except Exception as e:
-        logger.error(f"\n✗ Data ingestion failed: {e}")
+        logger.error("\n✗ Data ingestion failed: %s", e)
         import traceback
         traceback.print_exc()
         return
@@ -1,5 +1,7 @@
 """Script to run the FastAPI server."""
 
+import importlib.util
+import os
 import sys
 from pathlib import Path
 
@@ -7,21 +9,29 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 import uvicorn
-from backend.api.main import app
+
+# uvicorn[standard] ships uvloop and httptools; fall back to the pure-Python stack where they are missing (e.g. Windows)
+LOOP = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+HTTP = "httptools" if importlib.util.find_spec("httptools") else "h11"
+WORKERS = max(2, (os.cpu_count() or 1) - 1)
 
 if __name__ == "__main__":
     print("=" * 60)
     print("Cross-Asset Stress Scenario Simulator - API Server")
     print("=" * 60)
-    print("\nStarting FastAPI server...")
+    print(f"\nStarting FastAPI server ({WORKERS} workers, {LOOP} loop, {HTTP} parser)...")
     print("API Documentation: http://localhost:8000/docs")
     print("Dashboard: Open frontend/index.html in your browser")
     print("\nPress CTRL+C to stop the server")
     print("=" * 60 + "\n")
     
+    # Multiple workers need the import-string form so each process can import the app itself
     uvicorn.run(
-        app,
+        "backend.api.main:app",
         host="0.0.0.0",
         port=8000,
+        loop=LOOP,
+        http=HTTP,
+        workers=WORKERS,
         log_level="info"
     )
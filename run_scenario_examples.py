@@ -1,9 +1,12 @@
 """Example script demonstrating scenario management."""
 
 import sys
+from collections import Counter
 from pathlib import Path
 import logging
 
+import pandas as pd
+
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -20,33 +23,37 @@ logger = logging.getLogger(__name__)
 
 def display_scenario(scenario: dict):
     """Display scenario details."""
-    print(f"\n{'='*70}")
-    print(f"Scenario: {scenario['name']}")
-    print(f"{'='*70}")
-    print(f"Category: {scenario['category']}")
-    print(f"Tags: {', '.join(scenario['tags'])}")
-    print(f"\nDescription:")
-    print(f"  {scenario['description']}")
-    
-    print(f"\nParameters:")
+    # Build the whole block and write it once instead of one print() per line
+    lines = [
+        f"\n{'='*70}",
+        f"Scenario: {scenario['name']}",
+        f"{'='*70}",
+        f"Category: {scenario['category']}",
+        f"Tags: {', '.join(scenario['tags'])}",
+        f"\nDescription:",
+        f"  {scenario['description']}",
+        f"\nParameters:",
+    ]
     
     # Return shocks
     if 'return_shocks' in scenario['parameters']:
-        print(f"\n  Return Shocks:")
+        lines.append(f"\n  Return Shocks:")
         for ticker, shock in sorted(scenario['parameters']['return_shocks'].items()):
             direction = "↑" if shock > 0 else "↓"
-            print(f"    {ticker:15} {direction} {shock:+7.1%}")
+            lines.append(f"    {ticker:15} {direction} {shock:+7.1%}")
     
     # Volatility multipliers
     if 'volatility_multipliers' in scenario['parameters']:
-        print(f"\n  Volatility Multipliers:")
+        lines.append(f"\n  Volatility Multipliers:")
         for ticker, mult in sorted(scenario['parameters']['volatility_multipliers'].items()):
-            print(f"    {ticker:15} {mult:5.1f}x")
+            lines.append(f"    {ticker:15} {mult:5.1f}x")
     
     # Correlation multiplier
     if 'correlation_multiplier' in scenario['parameters']:
         mult = scenario['parameters']['correlation_multiplier']
-        print(f"\n  Correlation Multiplier: {mult:.1f}x")
+        lines.append(f"\n  Correlation Multiplier: {mult:.1f}x")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -59,56 +66,49 @@ def main():
     # Get all scenarios
     scenarios = PredefinedScenarios.get_all_scenarios()
     
-    print(f"\n\nAvailable Scenarios: {len(scenarios)}")
-    print("-" * 70)
-    for i, scenario in enumerate(scenarios, 1):
-        print(f"{i}. {scenario['name']:40} [{scenario['category']}]")
+    lines = [f"\n\nAvailable Scenarios: {len(scenarios)}", "-" * 70]
+    lines.extend(f"{i}. {scenario['name']:40} [{scenario['category']}]" for i, scenario in enumerate(scenarios, 1))
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Display each scenario in detail
     for scenario in scenarios:
         display_scenario(scenario)
     
+    # Columnar view of the SPY parameters used by the rankings below
+    summary = pd.DataFrame(
+        [
+            {
+                'name': scenario['name'],
+                'category': scenario['category'],
+                'spy_shock': scenario['parameters'].get('return_shocks', {}).get('SPY'),
+                'spy_vol': scenario['parameters'].get('volatility_multipliers', {}).get('SPY'),
+            }
+            for scenario in scenarios
+        ],
+        columns=['name', 'category', 'spy_shock', 'spy_vol'],
+    )
+    
     # Summary statistics
-    print(f"\n\n{'='*70}")
-    print("Scenario Summary")
-    print(f"{'='*70}")
+    lines = [f"\n\n{'='*70}", "Scenario Summary", f"{'='*70}"]
     
-    categories = {}
-    for scenario in scenarios:
-        cat = scenario['category']
-        categories[cat] = categories.get(cat, 0) + 1
+    categories = Counter(scenario['category'] for scenario in scenarios)
     
-    print(f"\nScenarios by Category:")
-    for cat, count in sorted(categories.items()):
-        print(f"  {cat:25} {count} scenario(s)")
+    lines.append(f"\nScenarios by Category:")
+    lines.extend(f"  {cat:25} {count} scenario(s)" for cat, count in sorted(categories.items()))
     
     # Most severe scenarios
-    print(f"\n\nMost Severe Equity Shocks:")
-    print("-" * 70)
-    
-    equity_shocks = []
-    for scenario in scenarios:
-        if 'return_shocks' in scenario['parameters']:
-            if 'SPY' in scenario['parameters']['return_shocks']:
-                shock = scenario['parameters']['return_shocks']['SPY']
-                equity_shocks.append((scenario['name'], shock))
+    lines.extend([f"\n\nMost Severe Equity Shocks:", "-" * 70])
     
-    for name, shock in sorted(equity_shocks, key=lambda x: x[1]):
-        print(f"  {name:40} {shock:+7.1%}")
+    for row in summary.dropna(subset=['spy_shock']).sort_values('spy_shock', kind='stable').itertuples():
+        lines.append(f"  {row.name:40} {row.spy_shock:+7.1%}")
     
     # Highest volatility scenarios
-    print(f"\n\nHighest Volatility Multipliers (SPY):")
-    print("-" * 70)
+    lines.extend([f"\n\nHighest Volatility Multipliers (SPY):", "-" * 70])
     
-    vol_mults = []
-    for scenario in scenarios:
-        if 'volatility_multipliers' in scenario['parameters']:
-            if 'SPY' in scenario['parameters']['volatility_multipliers']:
-                mult = scenario['parameters']['volatility_multipliers']['SPY']
-                vol_mults.append((scenario['name'], mult))
+    for row in summary.dropna(subset=['spy_vol']).sort_values('spy_vol', ascending=False, kind='stable').itertuples():
+        lines.append(f"  {row.name:40} {row.spy_vol:5.1f}x")
     
-    for name, mult in sorted(vol_mults, key=lambda x: x[1], reverse=True):
-        print(f"  {name:40} {mult:5.1f}x")
+    sys.stdout.write("\n".join(lines) + "\n")
     
     print(f"\n{'='*70}")
     print("Scenario examples completed!")
@@ -1,5 +1,8 @@
 """Example script demonstrating simulation engine usage."""
 
+import contextlib
+import io
+import os
 import sys
 from pathlib import Path
 import logging
@@ -10,6 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from backend.simulation.monte_carlo import MonteCarloSimulation
 from backend.simulation.historical_simulation import HistoricalSimulation
 from backend.simulation.correlation_matrix import CorrelationMatrix
+from backend.simulation.utils import worker_process_pool
 import numpy as np
 import pandas as pd
 
@@ -21,12 +25,18 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+SEPARATOR = "=" * 60
 
-def example_monte_carlo():
+# Shared workspace for the simulated return tensors: 3 assets x 10000 paths x 252 days of float64
+# covers the float32 Monte Carlo tensor and the historical bootstrap chunks alike
+WORKSPACE_SIZE = 3 * 10000 * 252
+
+
+def example_monte_carlo(workspace=None):
     """Example: Monte Carlo simulation."""
-    logger.info("=" * 60)
+    logger.info(SEPARATOR)
     logger.info("Example 1: Monte Carlo Simulation")
-    logger.info("=" * 60)
+    logger.info(SEPARATOR)
     
     # Define parameters
     initial_prices = {
@@ -66,7 +76,8 @@ def example_monte_carlo():
     results = mc_sim.simulate(
         num_simulations=10000,
         num_days=252,  # 1 year
-        random_seed=42
+        random_seed=42,
+        out=workspace
     )
     
     # Calculate statistics
@@ -84,11 +95,11 @@ def example_monte_carlo():
             print(f"  {key}: {value}")
 
 
-def example_historical_simulation():
+def example_historical_simulation(workspace=None):
     """Example: Historical simulation."""
-    logger.info("\n" + "=" * 60)
+    logger.info("\n%s", SEPARATOR)
     logger.info("Example 2: Historical Simulation")
-    logger.info("=" * 60)
+    logger.info(SEPARATOR)
     
     # Generate synthetic historical returns
     np.random.seed(42)
@@ -117,7 +128,8 @@ def example_historical_simulation():
         num_simulations=10000,
         num_days=252,
         block_size=5,  # 5-day blocks
-        random_seed=42
+        random_seed=42,
+        out=workspace
     )
     
     # Calculate statistics
@@ -137,9 +149,9 @@ def example_historical_simulation():
 
 def example_correlation_analysis():
     """Example: Correlation matrix analysis."""
-    logger.info("\n" + "=" * 60)
+    logger.info("\n%s", SEPARATOR)
     logger.info("Example 3: Correlation Analysis")
-    logger.info("=" * 60)
+    logger.info(SEPARATOR)
     
     # Generate synthetic returns
     np.random.seed(42)
@@ -176,6 +188,33 @@ def example_correlation_analysis():
     print(cholesky.round(3))
 
 
+_workspace = None
+
+
+def _process_workspace():
+    """Return this process's returns workspace, allocating it on first use."""
+    global _workspace
+    if _workspace is None:
+        _workspace = np.empty(WORKSPACE_SIZE, dtype=np.float64)
+    return _workspace
+
+
+def _run_example(example, uses_workspace):
+    """Run one example, handing it the process's returns workspace if it takes one."""
+    if uses_workspace:
+        example(_process_workspace())
+    else:
+        example()
+
+
+def _run_captured(example, uses_workspace):
+    """Run one example in a worker process and return everything it printed."""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        _run_example(example, uses_workspace)
+    return buffer.getvalue()
+
+
 def main():
     """Run all examples."""
     print("\n" + "=" * 60)
@@ -183,10 +222,20 @@ def main():
     print("Phase 2: Simulation Engine Examples")
     print("=" * 60)
     
-    # Run examples
-    example_monte_carlo()
-    example_historical_simulation()
-    example_correlation_analysis()
+    # The examples share no state, so run them in spawned single-threaded worker processes and
+    # replay their printed output in order so the sections do not interleave. Each worker reuses
+    # its own buffer for the simulated returns across the examples it runs. On a single core the
+    # worker start-up would only add time, so run them in-process, sharing one buffer.
+    examples = [example_monte_carlo, example_historical_simulation, example_correlation_analysis]
+    uses_workspace = [True, True, False]
+    num_workers = min(len(examples), os.cpu_count() or 1)
+    if num_workers > 1:
+        with worker_process_pool(num_workers) as executor:
+            for output in executor.map(_run_captured, examples, uses_workspace):
+                sys.stdout.write(output)
+    else:
+        for example, takes_workspace in zip(examples, uses_workspace):
+            _run_example(example, takes_workspace)
     
     print("\n" + "=" * 60)
     print("Examples completed successfully!")